@@ -5,9 +5,11 @@ import asyncio
 from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import timedelta
+import time
 from typing import Any, cast
 
 import jwt
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant import data_entry_flow
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
@@ -15,7 +17,12 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import (
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+    VERIFIED_ACCESS_TOKEN_CACHE_SIZE,
+    VERIFIED_ACCESS_TOKEN_CACHE_TTL,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -158,6 +165,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Access tokens with a verified signature mapped to the id of
+        # their refresh token and the timestamp until they are trusted
+        # without verifying them again.
+        self._verified_access_tokens: LRU = LRU(VERIFIED_ACCESS_TOKEN_CACHE_SIZE)
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -474,6 +485,13 @@ class AuthManager:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
 
+        for token in [
+            token
+            for token, (refresh_token_id, _) in self._verified_access_tokens.items()
+            if refresh_token_id == refresh_token.id
+        ]:
+            del self._verified_access_tokens[token]
+
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
             revoke_callback()
@@ -554,28 +572,44 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
-        try:
-            unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
-        except jwt.InvalidTokenError:
-            return None
-
-        refresh_token = await self.async_get_refresh_token(
-            cast(str, unverif_claims.get("iss"))
-        )
-
-        if refresh_token is None:
-            jwt_key = ""
-            issuer = ""
+        now = time.time()
+        if (cached := self._verified_access_tokens.get(token)) is not None and (
+            now < cached[1]
+        ):
+            # The refresh token is looked up again in case it was removed
+            refresh_token = await self.async_get_refresh_token(cached[0])
         else:
-            jwt_key = refresh_token.jwt_key
-            issuer = refresh_token.id
+            try:
+                unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
+            except jwt.InvalidTokenError:
+                return None
 
-        try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            refresh_token = await self.async_get_refresh_token(
+                cast(str, unverif_claims.get("iss"))
             )
-        except jwt.InvalidTokenError:
-            return None
+
+            if refresh_token is None:
+                jwt_key = ""
+                issuer = ""
+            else:
+                jwt_key = refresh_token.jwt_key
+                issuer = refresh_token.id
+
+            try:
+                claims = jwt_wrapper.verify_and_decode(
+                    token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+                )
+            except jwt.InvalidTokenError:
+                return None
+
+            if refresh_token is not None:
+                self._verified_access_tokens[token] = (
+                    refresh_token.id,
+                    min(
+                        now + VERIFIED_ACCESS_TOKEN_CACHE_TTL.total_seconds(),
+                        claims["exp"],
+                    ),
+                )
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
 import hmac
 from logging import getLogger
 from typing import Any
@@ -46,6 +47,10 @@ class AuthStore:
         self._users: dict[str, models.User] | None = None
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
+        # Indexes of the refresh tokens of all users by id and by the
+        # hash of the token, so they can be looked up without a scan
+        self._refresh_tokens: dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_hash: dict[str, models.RefreshToken] = {}
         self._store = Store[dict[str, list[dict[str, Any]]]](
             hass, STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
         )
@@ -150,6 +155,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_remove_refresh_token_from_index(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -238,6 +245,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_add_refresh_token_to_index(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -250,10 +258,10 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        if found := self._refresh_tokens.get(refresh_token.id):
+            found.user.refresh_tokens.pop(found.id, None)
+            self._async_remove_refresh_token_from_index(found)
+            self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -263,12 +271,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -278,14 +281,31 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        found = self._refresh_tokens_by_hash.get(_refresh_token_hash(token))
+        if found is not None and hmac.compare_digest(found.token, token):
+            return found
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        return None
 
-        return found
+    @callback
+    def _async_add_refresh_token_to_index(
+        self, refresh_token: models.RefreshToken
+    ) -> None:
+        """Add a refresh token to the indexes."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_hash[
+            _refresh_token_hash(refresh_token.token)
+        ] = refresh_token
+
+    @callback
+    def _async_remove_refresh_token_from_index(
+        self, refresh_token: models.RefreshToken
+    ) -> None:
+        """Remove a refresh token from the indexes."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        token_hash = _refresh_token_hash(refresh_token.token)
+        if self._refresh_tokens_by_hash.get(token_hash) is refresh_token:
+            del self._refresh_tokens_by_hash[token_hash]
 
     @callback
     def async_log_refresh_token_usage(
@@ -490,6 +510,7 @@ class AuthStore:
             if "credential_id" in rt_dict:
                 token.credential = credentials.get(rt_dict["credential_id"])
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._async_add_refresh_token_to_index(token)
 
         self._groups = groups
         self._users = users
@@ -594,6 +615,15 @@ class AuthStore:
         self._groups = groups
 
 
+def _refresh_token_hash(token: str) -> str:
+    """Return the hash of a refresh token used to index it.
+
+    The index is keyed by the hash instead of the token so looking up
+    a token does not compare it with the stored tokens in variable time.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def _system_admin_group() -> models.Group:
     """Create system admin group."""
     return models.Group(
@@ -134,6 +134,7 @@ async def async_setup_hass(
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
     loader.async_setup(hass)
+    loader.async_setup_manifest_cache(hass)
     config_dict = None
     basic_setup_success = False
 
@@ -186,6 +187,7 @@ async def async_setup_hass(
         hass.config.external_url = old_config.external_url
         # Setup loader cache after the config dir has been set
         loader.async_setup(hass)
+        loader.async_setup_manifest_cache(hass)
 
     if safe_mode:
         _LOGGER.info("Starting in safe mode")
@@ -536,6 +538,48 @@ async def async_setup_multi_components(
             )
 
 
+def _get_setup_critical_path(
+    setup_time: dict[str, timedelta], integrations: dict[str, loader.Integration]
+) -> list[str]:
+    """Return the chain of dependent integrations which took longest to set up.
+
+    The setup time of an integration does not include waiting on its
+    dependencies, so the longest chain is the one that would still delay
+    startup if every other integration was set up instantly.
+    """
+    chain_time: dict[str, float] = {}
+    chain_next: dict[str, str | None] = {}
+
+    def _chain_time(domain: str) -> float:
+        if (seconds := chain_time.get(domain)) is not None:
+            return seconds
+        # Guard against cycles, which are rejected when setting up
+        chain_time[domain] = 0
+        longest_dep: str | None = None
+        longest_dep_time = 0.0
+        if (integration := integrations.get(domain)) is not None:
+            for dep in (*integration.dependencies, *integration.after_dependencies):
+                if dep in setup_time and (dep_time := _chain_time(dep)) > (
+                    longest_dep_time
+                ):
+                    longest_dep, longest_dep_time = dep, dep_time
+        chain_next[domain] = longest_dep
+        seconds = chain_time[domain] = (
+            setup_time[domain].total_seconds() + longest_dep_time
+        )
+        return seconds
+
+    if not setup_time:
+        return []
+    domain: str | None = max(setup_time, key=_chain_time)
+    path: list[str] = []
+    while domain is not None:
+        path.append(domain)
+        domain = chain_next[domain]
+    path.reverse()
+    return path
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -685,3 +729,11 @@ async def _async_set_up_integrations(
             )
         },
     )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Integration setup critical path: %s",
+            " -> ".join(
+                f"{domain} ({setup_time[domain].total_seconds():.2f}s)"
+                for domain in _get_setup_critical_path(setup_time, integration_cache)
+            ),
+        )
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
-from typing import cast
+from typing import Any, cast
 
 from aiohttp import web
 import voluptuous as vol
@@ -13,7 +13,7 @@ from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.core import HomeAssistant, valid_entity_id
+from homeassistant.core import HomeAssistant, State, valid_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
 from homeassistant.helpers.typing import ConfigType
@@ -21,7 +21,7 @@ import homeassistant.util.dt as dt_util
 
 from . import websocket_api
 from .const import DOMAIN
-from .helpers import entities_may_have_state_changes_after
+from .helpers import downsample_states, entities_may_have_state_changes_after
 
 CONF_ORDER = "use_include_order"
 
@@ -105,6 +105,15 @@ class HistoryPeriodView(HomeAssistantView):
         minimal_response = "minimal_response" in request.query
         no_attributes = "no_attributes" in request.query
 
+        max_points: int | None = None
+        if max_points_str := query.get("max_points"):
+            try:
+                max_points = int(max_points_str)
+            except ValueError:
+                max_points = 0
+            if max_points < 2:
+                return self.json_message("Invalid max_points", HTTPStatus.BAD_REQUEST)
+
         if (
             not include_start_time_state
             and entity_ids
@@ -126,6 +135,7 @@ class HistoryPeriodView(HomeAssistantView):
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
+                max_points,
             ),
         )
 
@@ -139,22 +149,32 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
+        max_points: int | None,
     ) -> web.Response:
         """Fetch significant stats from the database as json."""
         with session_scope(hass=hass, read_only=True) as session:
-            return self.json(
-                list(
-                    history.get_significant_states_with_session(
-                        hass,
-                        session,
-                        start_time,
-                        end_time,
-                        entity_ids,
-                        None,
-                        include_start_time_state,
-                        significant_changes_only,
-                        minimal_response,
-                        no_attributes,
-                    ).values()
-                )
+            states = history.get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
             )
+            if max_points:
+                for entity_id, entity_states in states.items():
+                    states[entity_id] = downsample_states(
+                        entity_states, max_points, _get_state
+                    )
+            return self.json(list(states.values()))
+
+
+def _get_state(state: State | dict[str, Any]) -> str:
+    """Return the state of a full or a minimal response state."""
+    if isinstance(state, dict):
+        return cast(str, state["state"])
+    return state.state
@@ -1,11 +1,15 @@
 """Helpers for the history integration."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import datetime as dt
+import math
+from typing import TypeVar
 
 from homeassistant.core import HomeAssistant
 
+_StateT = TypeVar("_StateT")
+
 
 def entities_may_have_state_changes_after(
     hass: HomeAssistant, entity_ids: Iterable, start_time: dt, no_attributes: bool
@@ -21,3 +25,55 @@ def entities_may_have_state_changes_after(
             return True
 
     return False
+
+
+def downsample_states(
+    states: list[_StateT], max_points: int, get_state: Callable[[_StateT], str]
+) -> list[_StateT]:
+    """Downsample the numeric states of an entity to at most max_points.
+
+    States of entities without any finite numeric state, such as binary
+    sensors, are returned unchanged. Otherwise the first and the last
+    state are always kept and the states between them are split into
+    buckets of about the same number of states. Each bucket keeps the
+    states with the minimum and the maximum value, so peaks are not lost.
+
+    Every change to or from a value that is not a finite number, such as
+    unavailable, is kept as well, so these states may add points on top
+    of max_points.
+    """
+    if len(states) <= max_points:
+        return states
+    values: list[float] = []
+    for state in states:
+        try:
+            values.append(float(get_state(state)))
+        except ValueError:
+            values.append(math.nan)
+    if not any(math.isfinite(value) for value in values):
+        return states
+
+    last = len(states) - 1
+    keep: set[int] = {0, last}
+    previous: str | None = None
+    for idx, value in enumerate(values):
+        if math.isfinite(value):
+            if previous is not None:
+                keep.add(idx)
+                previous = None
+        elif (current := get_state(states[idx])) != previous:
+            keep.add(idx)
+            previous = current
+
+    buckets = (max_points - 2) // 2
+    for bucket in range(buckets):
+        start = 1 + bucket * (last - 1) // buckets
+        end = 1 + (bucket + 1) * (last - 1) // buckets
+        if numeric := [
+            (values[idx], idx)
+            for idx in range(start, end)
+            if math.isfinite(values[idx])
+        ]:
+            keep.add(min(numeric)[1])
+            keep.add(max(numeric)[1])
+    return [states[idx] for idx in sorted(keep)]
@@ -6,6 +6,7 @@ from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+from operator import itemgetter
 from typing import Any, cast
 
 import voluptuous as vol
@@ -39,7 +40,7 @@ from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after
+from .helpers import downsample_states, entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +63,40 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _get_compressed_significant_states(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> MutableMapping[str, list[dict[str, Any]]]:
+    """Fetch history significant_states in the compressed state format."""
+    states = cast(
+        MutableMapping[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    if max_points:
+        get_state = itemgetter(COMPRESSED_STATE_STATE)
+        for entity_id, entity_states in states.items():
+            states[entity_id] = downsample_states(entity_states, max_points, get_state)
+    return states
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -72,27 +107,111 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
     return JSON_DUMP(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_compressed_significant_states(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
+                max_points,
             ),
         )
     )
 
 
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_id: str,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+    partial: bool,
+) -> str:
+    """Fetch history significant_states of one entity and convert them to json.
+
+    This is run in the executor.
+    """
+    message = _generate_stream_message(
+        _get_compressed_significant_states(
+            hass,
+            start_time,
+            end_time,
+            [entity_id],
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            max_points,
+        ),
+        start_time,
+        end_time,
+    )
+    if partial:
+        message["partial"] = True
+    return JSON_DUMP(messages.event_message(msg_id, message))
+
+
+async def _async_send_significant_states_chunked(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> None:
+    """Send the history of each entity in its own message.
+
+    Only the history of one entity is held in memory at a time,
+    every message except the last one is marked as partial.
+    """
+    instance = get_instance(hass)
+    connection.subscriptions[msg_id] = callback(lambda: None)
+    connection.send_result(msg_id)
+    last_idx = len(entity_ids) - 1
+    try:
+        for idx, entity_id in enumerate(entity_ids):
+            if msg_id not in connection.subscriptions:
+                # Unsubscribe happened while sending the history
+                return
+            connection.send_message(
+                await instance.async_add_executor_job(
+                    _ws_get_significant_states_chunk,
+                    hass,
+                    msg_id,
+                    start_time,
+                    end_time,
+                    entity_id,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    max_points,
+                    idx != last_idx,
+                )
+            )
+    finally:
+        connection.subscriptions.pop(msg_id, None)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,15 +222,22 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    With chunked, the result is sent first and the history is
+    sent in an event message per entity instead.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
+    chunked: bool = msg["chunked"]
 
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
@@ -129,7 +255,10 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        if chunked:
+            _async_send_empty_response(connection, msg["id"], start_time, end_time)
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -141,18 +270,38 @@ async def ws_get_history_during_period(
     include_start_time_state = msg["include_start_time_state"]
     no_attributes = msg["no_attributes"]
 
-    if (
+    if (chunked and not entity_ids) or (
         not include_start_time_state
         and entity_ids
         and not entities_may_have_state_changes_after(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        if chunked:
+            _async_send_empty_response(connection, msg["id"], start_time, end_time)
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
+
+    if chunked:
+        await _async_send_significant_states_chunked(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time or dt_util.utcnow(),
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            max_points,
+        )
+        return
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -166,6 +315,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
     )
 
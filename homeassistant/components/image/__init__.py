@@ -22,7 +22,11 @@ from homeassistant.helpers.config_validation import (  # noqa: F401
     PLATFORM_SCHEMA,
     PLATFORM_SCHEMA_BASE,
 )
-from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity import (
+    Entity,
+    EntityDescription,
+    async_write_ha_states,
+)
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.httpx_client import get_async_client
@@ -95,7 +99,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         """Update tokens of the entities."""
         for entity in component.entities:
             entity.async_update_token()
-            entity.async_write_ha_state()
+        async_write_ha_states(hass, component.entities)
 
     unsub = async_track_time_interval(
         hass, update_tokens, TOKEN_CHANGE_INTERVAL, name="Image update tokens"
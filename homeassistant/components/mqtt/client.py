@@ -2,8 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from functools import lru_cache
+from collections.abc import Callable, Coroutine, Iterable, Iterator, MutableMapping
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -14,6 +13,7 @@ import uuid
 
 import attr
 import certifi
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -93,6 +93,7 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -289,6 +290,112 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _WildcardSubscriptionNode:
+    """A topic level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _WildcardSubscriptionNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class WildcardSubscriptions:
+    """Trie of wildcard subscriptions indexed by topic level.
+
+    Matching a topic walks the trie level by level following the literal
+    level as well as the `+` and `#` wildcard nodes, so the cost depends
+    on the depth of the topic and not on the number of subscriptions.
+    """
+
+    __slots__ = ("_root", "_subscriptions", "_added")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _WildcardSubscriptionNode()
+        # Keeps the subscriptions in insertion order
+        self._subscriptions: dict[Subscription, int] = {}
+        self._added = 0
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in insertion order."""
+        return iter(self._subscriptions)
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return len(self._subscriptions)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _WildcardSubscriptionNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._subscriptions[subscription] = self._added
+        self._added += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError or ValueError if the subscription is unknown.
+        """
+        del self._subscriptions[subscription]
+        path: list[tuple[_WildcardSubscriptionNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the levels which no longer lead to a subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription with exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching topic.
+
+        The subscriptions are returned in the order they were added.
+
+        Follows the matching rules of paho.mqtt.matcher.MQTTMatcher:
+        wildcards at the first level do not match topics starting with `$`.
+        """
+        levels = topic.split("/")
+        last = len(levels)
+        normal = not topic.startswith("$")
+        subscriptions: list[Subscription] = []
+        pending: list[tuple[_WildcardSubscriptionNode, int]] = [(self._root, 0)]
+        while pending:
+            node, idx = pending.pop()
+            children = node.children
+            wildcards_allowed = normal or idx > 0
+            if wildcards_allowed and (multi := children.get("#")) is not None:
+                subscriptions.extend(multi.subscriptions)
+            if idx == last:
+                subscriptions.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                pending.append((child, idx + 1))
+            if wildcards_allowed and (single := children.get("+")) is not None:
+                pending.append((single, idx + 1))
+        if len(subscriptions) > 1:
+            subscriptions.sort(key=self._subscriptions.__getitem__)
+        return subscriptions
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -381,7 +488,10 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = WildcardSubscriptions()
+        self._matching_subscriptions_cache: MutableMapping[
+            str, list[Subscription]
+        ] = LRU(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -484,8 +594,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -566,7 +676,7 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._matching_subscriptions_cache.clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
@@ -574,14 +684,15 @@ class MQTT:
 
         This method does not send a SUBSCRIBE message to the broker.
 
-        The caller is responsible clearing the cache of _matching_subscriptions.
+        The caller is responsible for invalidating the cache of
+        _matching_subscriptions.
         """
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -589,7 +700,8 @@ class MQTT:
 
         This method does not send an UNSUBSCRIBE message to the broker.
 
-        The caller is responsible clearing the cache of _matching_subscriptions.
+        The caller is responsible for invalidating the cache of
+        _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -603,6 +715,21 @@ class MQTT:
         except (KeyError, ValueError) as ex:
             raise HomeAssistantError("Can't remove subscription twice") from ex
 
+    @callback
+    def _async_invalidate_matching_subscriptions(
+        self, subscription: Subscription
+    ) -> None:
+        """Invalidate the cached matches for topics affected by a subscription.
+
+        A simple subscription only affects its own topic, a wildcard
+        subscription may affect any cached topic.
+        """
+        cache = self._matching_subscriptions_cache
+        if _is_simple_match(topic := subscription.topic):
+            cache.pop(topic, None)
+        else:
+            cache.clear()
+
     @callback
     def _async_queue_subscriptions(
         self, subscriptions: Iterable[tuple[str, int]], queue_only: bool = False
@@ -638,7 +765,7 @@ class MQTT:
             topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
         )
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._async_invalidate_matching_subscriptions(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -648,7 +775,7 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._async_invalidate_matching_subscriptions(subscription)
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -809,14 +936,17 @@ class MQTT:
         """Message received callback."""
         self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        """Return the subscriptions matching a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.matches(topic))
+        cache[topic] = subscriptions
         return subscriptions
 
     @callback
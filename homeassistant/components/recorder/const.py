@@ -30,6 +30,11 @@ QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 # have upgraded their sqlite version
 SQLITE_MAX_BIND_VARS = 998
 
+# MySQL, MariaDB and PostgreSQL support far more bind variables in
+# a statement, which lets a purge delete larger batches of rows with
+# fewer round trips on large databases
+DEFAULT_MAX_BIND_VARS = 4000
+
 DB_WORKER_PREFIX = "DbWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
@@ -78,6 +78,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -91,6 +92,8 @@ from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
+from .table_managers.statistics_reduced import StatisticsReducedManager
+from .table_managers.statistics_short_term import StatisticsShortTermManager
 from .tasks import (
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
@@ -225,14 +228,20 @@ class Recorder(threading.Thread):
             self, exclude_attributes_by_domain
         )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.statistics_short_term_manager = StatisticsShortTermManager(self)
+        self.statistics_reduced_manager = StatisticsReducedManager(self)
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
+        self.purge_progress: PurgeProgress | None = None
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        # States are written with multi-row inserts when the database
+        # supports returning the ids of the inserted rows in order
+        self.bulk_insert_states = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -884,6 +893,7 @@ class Recorder(threading.Thread):
 
         assert self.event_session is not None
         session = self.event_session
+        self.state_attributes_manager.load_recently_used(session)
         self.event_data_manager.load(non_state_change_events, session)
         self.event_type_manager.load(non_state_change_events, session)
         self.states_meta_manager.load(state_change_events, session)
@@ -1136,7 +1146,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self.bulk_insert_states:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_insert(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1175,6 +1189,11 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self.bulk_insert_states:
+            # Flush first so the pending StatesMeta and StateAttributes
+            # have ids the bulk insert of the states can link to
+            session.flush()
+            self.states_manager.insert_pending(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1213,6 +1232,7 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.statistics_short_term_manager.reset()
 
         if not self.event_session:
             return
@@ -1398,6 +1418,9 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        self.bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -306,6 +306,7 @@ def _state_changed_during_period_stmt(
     end_time_ts: float | None,
     single_metadata_id: int,
     no_attributes: bool,
+    descending: bool,
     limit: int | None,
     include_start_time_state: bool,
     run_start_ts: float | None,
@@ -327,12 +328,24 @@ def _state_changed_during_period_stmt(
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    if limit:
-        stmt = stmt.limit(limit)
-    stmt = stmt.order_by(
-        States.metadata_id,
-        States.last_updated_ts,
-    )
+    if limit and descending:
+        # Limit to the newest states, the states are still
+        # returned in ascending order and reversed afterwards
+        newest = (
+            stmt.order_by(States.metadata_id, States.last_updated_ts.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = _select_from_subquery(newest, no_attributes, False).order_by(
+            newest.c.metadata_id, newest.c.last_updated_ts
+        )
+    else:
+        if limit:
+            stmt = stmt.limit(limit)
+        stmt = stmt.order_by(
+            States.metadata_id,
+            States.last_updated_ts,
+        )
     if not include_start_time_state or not run_start_ts:
         return stmt
     return _select_from_subquery(
@@ -398,6 +411,7 @@ def state_changes_during_period(
                 end_time_ts,
                 single_metadata_id,
                 no_attributes,
+                descending,
                 limit,
                 include_start_time_state,
                 run_start_ts,
@@ -405,6 +419,7 @@ def state_changes_during_period(
             track_on=[
                 bool(end_time_ts),
                 no_attributes,
+                descending,
                 bool(limit),
                 include_start_time_state,
             ],
@@ -650,7 +665,7 @@ def _sorted_states_to_dict(
     """
     field_map = _FIELD_MAP
     state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        [Row, dict[str, Any], float | None, str, str, float | None, bool],
         State | dict[str, Any],
     ]
     if compressed_state_format:
@@ -683,11 +698,13 @@ def _sorted_states_to_dict(
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
+    # The attributes are shared between entities since they are
+    # stored deduplicated in the database
+    attr_cache: dict[str, Any] = {}
 
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
-        attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
         if (
             not minimal_response
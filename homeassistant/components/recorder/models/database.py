@@ -19,6 +19,7 @@ class DatabaseEngine:
     dialect: SupportedDialect
     optimizer: DatabaseOptimizer
     version: AwesomeVersion | None
+    max_bind_vars: int
 
 
 @dataclass
@@ -5,6 +5,7 @@ from datetime import datetime
 import logging
 from typing import Any
 
+import orjson
 from sqlalchemy.engine.row import Row
 
 from homeassistant.const import (
@@ -16,7 +17,10 @@ from homeassistant.const import (
 from homeassistant.core import Context, State
 import homeassistant.util.dt as dt_util
 
-from .state_attributes import decode_attributes_from_source
+from .state_attributes import (
+    decode_attributes_from_source,
+    json_fragment_attributes_from_source,
+)
 from .time import process_timestamp
 
 _LOGGER = logging.getLogger(__name__)
@@ -139,17 +143,21 @@ class LazyState(State):
 
 def row_to_compressed_state(
     row: Row,
-    attr_cache: dict[str, dict[str, Any]],
+    attr_cache: dict[str, orjson.Fragment],
     start_time_ts: float | None,
     entity_id: str,
     state: str,
     last_updated_ts: float | None,
     no_attributes: bool,
 ) -> dict[str, Any]:
-    """Convert a database row to a compressed state schema 41 and later."""
+    """Convert a database row to a compressed state schema 41 and later.
+
+    The attributes are returned as a json fragment since the compressed
+    state is only used to be serialized to json.
+    """
     comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state}
     if not no_attributes:
-        comp_state[COMPRESSED_STATE_ATTRIBUTES] = decode_attributes_from_source(
+        comp_state[COMPRESSED_STATE_ATTRIBUTES] = json_fragment_attributes_from_source(
             getattr(row, "attributes", None), attr_cache
         )
     row_last_updated_ts: float = last_updated_ts or start_time_ts  # type: ignore[assignment]
@@ -5,9 +5,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import orjson
+
 from homeassistant.util.json import json_loads_object
 
 EMPTY_JSON_OBJECT = "{}"
+EMPTY_JSON_OBJECT_FRAGMENT = orjson.Fragment(EMPTY_JSON_OBJECT)
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,3 +28,28 @@ def decode_attributes_from_source(
         _LOGGER.exception("Error converting row to state attributes: %s", source)
         attr_cache[source] = attributes = {}
     return attributes
+
+
+def json_fragment_attributes_from_source(
+    source: Any, fragment_cache: dict[str, orjson.Fragment]
+) -> orjson.Fragment:
+    """Return attributes from a row source as a pre-encoded json fragment.
+
+    The attributes are only decoded once per distinct source to make sure
+    they are valid json, after which the source is embedded as is when the
+    result is serialized instead of encoding the attributes again for
+    every row.
+    """
+    if not source or source == EMPTY_JSON_OBJECT:
+        return EMPTY_JSON_OBJECT_FRAGMENT
+    if (fragment := fragment_cache.get(source)) is not None:
+        return fragment
+    try:
+        json_loads_object(source)
+    except ValueError:
+        _LOGGER.exception("Error converting row to state attributes: %s", source)
+        fragment = EMPTY_JSON_OBJECT_FRAGMENT
+    else:
+        fragment = orjson.Fragment(source)
+    fragment_cache[source] = fragment
+    return fragment
@@ -1,5 +1,6 @@
 """A pool for sqlite connections."""
 import logging
+import os
 import threading
 import traceback
 from typing import Any
@@ -23,7 +24,26 @@ _LOGGER = logging.getLogger(__name__)
 DEBUG_MUTEX_POOL = True
 DEBUG_MUTEX_POOL_TRACE = False
 
-POOL_SIZE = 5
+MIN_DB_WORKERS = 4
+# Keeps the connections within the default QueuePool size plus overflow
+# (15) used for MySQL/PostgreSQL, with room for connections made outside
+# of the recorder thread and db executor
+MAX_DB_WORKERS = 10
+
+
+def get_pool_size(cpu_count: int | None) -> int:
+    """Return the number of connections for the recorder and db executor.
+
+    The recorder thread and each db executor worker get their own
+    connection. The executor is sized to the number of CPUs so concurrent
+    history, logbook and statistics queries do not have to wait for each
+    other, as SQLite releases the GIL while it runs a query. More workers
+    than CPUs only make the queries compete for them.
+    """
+    return min(max(cpu_count or 1, MIN_DB_WORKERS), MAX_DB_WORKERS) + 1
+
+
+POOL_SIZE = get_pool_size(os.cpu_count())
 
 ADVISE_MSG = (
     "Use homeassistant.components.recorder.get_instance(hass).async_add_executor_job()"
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
@@ -37,6 +38,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_state_last_updated_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -52,6 +54,42 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# The time in seconds a purge run may take before it stops after the
+# current batch to let the recorder process the queue before continuing
+DEFAULT_PURGE_TIME_BUDGET = 2.0
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Track the progress of purging old data.
+
+    The remaining time is estimated from how much of the history
+    before purge_before has been purged so far, since counting the
+    rows that are left would be too slow on large databases.
+    """
+
+    purge_before: datetime
+    first_oldest_ts: float | None
+    oldest_ts: float | None = None
+    rows: int = 0
+    start: float = field(default_factory=time.monotonic)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of rows purged per second."""
+        return self.rows / max(time.monotonic() - self.start, 1)
+
+    @property
+    def remaining_seconds(self) -> float | None:
+        """Return the estimated number of seconds until the purge is done."""
+        if (
+            self.first_oldest_ts is None
+            or self.oldest_ts is None
+            or (purged := self.oldest_ts - self.first_oldest_ts) <= 0
+        ):
+            return None
+        remaining = max(self.purge_before.timestamp() - self.oldest_ts, 0)
+        return remaining / purged * (time.monotonic() - self.start)
 
 
 @retryable_database_job("purge")
@@ -62,16 +100,60 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float = DEFAULT_PURGE_TIME_BUDGET,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    Stops after the batch that exceeds the time budget so the
+    recorder can process its queue before the purge continues.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    deadline = time.monotonic() + time_budget
+    # The progress is kept while the purge is not finished. Retried
+    # failures are swallowed, so it is reset in a finally.
+    unfinished = False
+    try:
+        unfinished = not _purge_old_data(
+            instance,
+            purge_before,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            deadline,
+        )
+    finally:
+        if not unfinished:
+            instance.purge_progress = None
+    if unfinished:
+        return False
+    if repack:
+        repack_database(instance)
+    return True
+
+
+def _purge_old_data(
+    instance: Recorder,
+    purge_before: datetime,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    deadline: float,
+) -> bool:
+    """Purge a batch of events and states older than purge_before.
+
+    Returns true if the purge is finished.
+    """
     with session_scope(session=instance.get_session()) as session:
+        progress = instance.purge_progress
+        if progress is None or progress.purge_before != purge_before:
+            progress = instance.purge_progress = PurgeProgress(
+                purge_before, _oldest_state_last_updated_ts(session)
+            )
         # Purge a max of SQLITE_MAX_BIND_VARS, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -80,6 +162,7 @@ def purge_old_data(
                 " remaining"
             )
             has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            progress.oldest_ts = _oldest_state_last_updated_ts(session)
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -87,11 +170,22 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress, deadline
             )
+            if has_more_to_purge and time.monotonic() > deadline:
+                # The states used up the time budget, leave the events
+                # to the next purge
+                _LOGGER.debug("Purge time budget exceeded before purging events")
+            else:
+                has_more_to_purge |= _purge_events_and_data_ids(
+                    instance,
+                    session,
+                    events_batch_size,
+                    purge_before,
+                    progress,
+                    deadline,
+                )
+            progress.oldest_ts = _oldest_state_last_updated_ts(session)
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
         short_term_statistics = _select_short_term_statistics_to_purge(
@@ -102,6 +196,7 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            instance.statistics_short_term_manager.discard_before(purge_before)
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -121,11 +216,17 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
-    if repack:
-        repack_database(instance)
+    _LOGGER.debug(
+        "Purged %s rows at %.0f rows/s", progress.rows, progress.rows_per_second
+    )
     return True
 
 
+def _oldest_state_last_updated_ts(session: Session) -> float | None:
+    """Return the last_updated_ts of the oldest state."""
+    return session.execute(find_oldest_state_last_updated_ts()).scalar()
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -176,6 +277,8 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -187,17 +290,20 @@ def _purge_states_and_attributes_ids(
     # There are more states relative to attributes_ids so
     # we purge enough state_ids to try to generate a full
     # size batch of attributes_ids that will be around the size
-    # SQLITE_MAX_BIND_VARS
+    # max_bind_vars
     attributes_ids_batch: set[int] = set()
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before
+            session, purge_before, database_engine.max_bind_vars
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        progress.rows += len(state_ids)
+        if time.monotonic() > deadline:
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -212,24 +318,33 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
     Returns true if there are more states to purge.
     """
+    database_engine = instance.database_engine
+    assert database_engine is not None
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
     # we purge enough event_ids to try to generate a full
     # size batch of data_ids that will be around the size
-    # SQLITE_MAX_BIND_VARS
+    # max_bind_vars
     data_ids_batch: set[int] = set()
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(session, purge_before)
+        event_ids, data_ids = _select_event_data_ids_to_purge(
+            session, purge_before, database_engine.max_bind_vars
+        )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        progress.rows += len(event_ids)
+        if time.monotonic() > deadline:
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -240,13 +355,13 @@ def _purge_events_and_data_ids(
 
 
 def _select_state_attributes_ids_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
     """Return sets of state and attribute ids to purge."""
     state_ids = set()
     attributes_ids = set()
     for state_id, attributes_id in session.execute(
-        find_states_to_purge(dt_util.utc_to_timestamp(purge_before))
+        find_states_to_purge(dt_util.utc_to_timestamp(purge_before), max_bind_vars)
     ).all():
         state_ids.add(state_id)
         if attributes_id:
@@ -260,13 +375,13 @@ def _select_state_attributes_ids_to_purge(
 
 
 def _select_event_data_ids_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
     """Return sets of event and data ids to purge."""
     event_ids = set()
     data_ids = set()
     for event_id, data_id in session.execute(
-        find_events_to_purge(dt_util.utc_to_timestamp(purge_before))
+        find_events_to_purge(dt_util.utc_to_timestamp(purge_before), max_bind_vars)
     ).all():
         event_ids.add(event_id)
         if data_id:
@@ -511,8 +626,10 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
 def _purge_batch_attributes_ids(
     instance: Recorder, session: Session, attributes_ids: set[int]
 ) -> None:
-    """Delete old attributes ids in batches of SQLITE_MAX_BIND_VARS."""
-    for attributes_ids_chunk in chunked(attributes_ids, SQLITE_MAX_BIND_VARS):
+    """Delete old attributes ids in batches of max_bind_vars."""
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    for attributes_ids_chunk in chunked(attributes_ids, database_engine.max_bind_vars):
         deleted_rows = session.execute(
             delete_states_attributes_rows(attributes_ids_chunk)
         )
@@ -525,8 +642,10 @@ def _purge_batch_attributes_ids(
 def _purge_batch_data_ids(
     instance: Recorder, session: Session, data_ids: set[int]
 ) -> None:
-    """Delete old event data ids in batches of SQLITE_MAX_BIND_VARS."""
-    for data_ids_chunk in chunked(data_ids, SQLITE_MAX_BIND_VARS):
+    """Delete old event data ids in batches of max_bind_vars."""
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    for data_ids_chunk in chunked(data_ids, database_engine.max_bind_vars):
         deleted_rows = session.execute(delete_event_data_rows(data_ids_chunk))
         _LOGGER.debug("Deleted %s data events", deleted_rows)
 
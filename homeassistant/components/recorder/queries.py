@@ -42,6 +42,33 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def find_oldest_state_last_updated_ts() -> StatementLambdaElement:
+    """Find the last_updated_ts of the oldest recorded state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated_ts)))
+
+
+def find_latest_state_last_updated_ts() -> StatementLambdaElement:
+    """Find the last_updated_ts of the most recently recorded state."""
+    return lambda_stmt(lambda: select(func.max(States.last_updated_ts)))
+
+
+def find_shared_attributes_used_since(
+    start_ts: float, limit: int
+) -> StatementLambdaElement:
+    """Find the shared attributes used by states recorded since start_ts.
+
+    The most recently used attributes are returned first.
+    """
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id, StateAttributes.shared_attrs)
+        .join(States, States.attributes_id == StateAttributes.attributes_id)
+        .where(States.last_updated_ts >= start_ts)
+        .group_by(StateAttributes.attributes_id)
+        .order_by(func.max(States.last_updated_ts).desc())
+        .limit(limit)
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -612,21 +639,25 @@ def delete_recorder_runs_rows(
     )
 
 
-def find_events_to_purge(purge_before: float) -> StatementLambdaElement:
+def find_events_to_purge(
+    purge_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
     """Find events to purge."""
     return lambda_stmt(
         lambda: select(Events.event_id, Events.data_id)
         .filter(Events.time_fired_ts < purge_before)
-        .limit(SQLITE_MAX_BIND_VARS)
+        .limit(max_bind_vars)
     )
 
 
-def find_states_to_purge(purge_before: float) -> StatementLambdaElement:
+def find_states_to_purge(
+    purge_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
     """Find states to purge."""
     return lambda_stmt(
         lambda: select(States.state_id, States.attributes_id)
         .filter(States.last_updated_ts < purge_before)
-        .limit(SQLITE_MAX_BIND_VARS)
+        .limit(max_bind_vars)
     )
 
 
@@ -77,6 +77,7 @@ from .util import (
 
 if TYPE_CHECKING:
     from . import Recorder
+    from .table_managers.statistics_reduced import StatisticsReducedManager
 
 QUERY_STATISTICS = (
     Statistics.metadata_id,
@@ -339,13 +340,33 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    instance: Recorder, session: Session, start: datetime
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If all 5-minute statistics of the hour were compiled since the recorder
+    started, they are summarized from memory instead of querying the database.
     """
+    summary = instance.statistics_short_term_manager.get_hourly_summary(start)
+    if summary is None:
+        summary = _compile_hourly_statistics_summary(session, start)
+
+    # Insert compiled hourly statistics in the database
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def _compile_hourly_statistics_summary(
+    session: Session, start: datetime
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize the 5-minute statistics for one hour from the database."""
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
     end_time = start_time + timedelta(hours=1)
@@ -389,11 +410,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
-    )
+    return summary
 
 
 @retryable_database_job("compile missing statistics")
@@ -430,6 +447,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    instance.statistics_reduced_manager.reset()
     return True
 
 
@@ -447,6 +465,17 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         modified_statistic_ids = _compile_statistics(
             instance, session, start, fire_events
         )
+        # Commit here instead of when leaving the session scope since
+        # the session scope swallows unique constraint errors, and the
+        # compiled period must only be kept if it was committed
+        session.commit()
+        instance.statistics_short_term_manager.commit_pending()
+
+    if modified_statistic_ids:
+        instance.statistics_reduced_manager.reset()
+    elif start.minute == 55:
+        # The hour was summarized
+        instance.statistics_reduced_manager.invalidate(start.replace(minute=0))
 
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
@@ -477,6 +506,8 @@ def _compile_statistics(
     assert start.tzinfo == dt_util.UTC, "start must be in UTC"
     end = start + timedelta(minutes=5)
     statistics_meta_manager = instance.statistics_meta_manager
+    statistics_short_term_manager = instance.statistics_short_term_manager
+    statistics_short_term_manager.discard_pending()
     modified_statistic_ids: set[str] = set()
 
     # Return if we already have 5-minute statistics for the requested period
@@ -509,6 +540,7 @@ def _compile_statistics(
         current_metadata.update(compiled.current_metadata)
 
     # Insert collected statistics in the database
+    period_stats: dict[int, StatisticData] = {}
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
             session, stats["meta"], current_metadata
@@ -521,10 +553,12 @@ def _compile_statistics(
             metadata_id,
             stats["stat"],
         )
+        period_stats[metadata_id] = stats["stat"]
+    statistics_short_term_manager.add_pending(start, period_stats)
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(instance, session, start)
 
     session.add(StatisticsRuns(start=start))
 
@@ -651,6 +685,8 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    instance.statistics_short_term_manager.reset()
+    instance.statistics_reduced_manager.reset()
 
 
 def update_statistics_metadata(
@@ -674,6 +710,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    instance.statistics_reduced_manager.reset()
 
 
 async def async_list_statistic_ids(
@@ -1016,6 +1053,19 @@ def _reduce_statistics_per_month(
     )
 
 
+_PERIOD_START_END_TS_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1571,6 +1621,55 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _reduced_statistics_cache_key(
+    hass: HomeAssistant,
+    period: str,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple[Any, ...]:
+    """Return the key of statistics reduced per period in the cache."""
+    sorted_statistic_ids = sorted(metadata)
+    return (
+        period,
+        # The periods are aligned to the configured time zone
+        str(dt_util.DEFAULT_TIME_ZONE),
+        tuple(sorted_statistic_ids),
+        tuple(sorted(units.items())) if units else None,
+        tuple(sorted(types)),
+        # The statistics are converted to the unit of the entity's
+        # state unless a unit is requested
+        tuple(
+            state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            if (state := hass.states.get(statistic_id))
+            else None
+            for statistic_id in sorted_statistic_ids
+        ),
+    )
+
+
+def _cache_reduced_statistics(
+    statistics_reduced_manager: StatisticsReducedManager,
+    key: tuple[Any, ...],
+    period: str,
+    start_time: datetime,
+    end_time: datetime | None,
+    result: dict[str, list[StatisticsRow]],
+    generation: int,
+) -> None:
+    """Cache the statistics of the periods which have ended."""
+    # Only the periods which ended before the previous hour are cached
+    # since the statistics of the previous hour may not be compiled yet
+    compiled_ts = (
+        dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+    ).timestamp()
+    cache_end_ts = _PERIOD_START_END_TS_FACTORIES[period]()[1](compiled_ts)[0]
+    if end_time is not None:
+        cache_end_ts = min(cache_end_ts, end_time.timestamp())
+    if cache_end_ts > (start_ts := start_time.timestamp()):
+        statistics_reduced_manager.set(key, start_ts, cache_end_ts, result, generation)
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1590,8 +1689,9 @@ def _statistics_during_period_with_session(
         # This is for backwards compatibility to avoid a breaking change
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
+    instance = get_instance(hass)
     # Fetch metadata for the given (or all) statistic_ids
-    metadata = get_instance(hass).statistics_meta_manager.get_many(
+    metadata = instance.statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
     )
     if not metadata:
@@ -1641,38 +1741,74 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
+    query_start_time = start_time
+    cached_result: dict[str, list[StatisticsRow]] = {}
+    reduced_cache_key: tuple[Any, ...] | None = None
+    if period in ("day", "week", "month"):
+        statistics_reduced_manager = instance.statistics_reduced_manager
+        reduced_cache_key = _reduced_statistics_cache_key(
+            hass, period, metadata, units, types
+        )
+        generation = statistics_reduced_manager.generation
+        if cached := statistics_reduced_manager.get(
+            reduced_cache_key,
+            start_time.timestamp(),
+            end_time.timestamp() if end_time else None,
+        ):
+            # Only the periods which were not cached are reduced
+            cached_end_ts, cached_result = cached
+            query_start_time = dt_util.utc_from_timestamp(cached_end_ts)
+
+    result: dict[str, list[StatisticsRow]] = {}
+    if end_time is None or query_start_time < end_time:
+        stmt = _generate_statistics_during_period_stmt(
+            query_start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+        if stats:
+            result = _sorted_statistics_to_dict(
+                hass,
+                session,
+                stats,
+                statistic_ids,
+                metadata,
+                True,
+                table,
+                query_start_time,
+                units,
+                types,
+            )
 
-    if period == "day":
+    if result and period == "day":
         result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
+    if result and period == "week":
         result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
+    if result and period == "month":
         result = _reduce_statistics_per_month(result, types)
 
+    if cached_result:
+        for statistic_id, rows in result.items():
+            cached_result.setdefault(statistic_id, []).extend(rows)
+        result = cached_result
+
+    if not result:
+        return {}
+
+    if reduced_cache_key is not None:
+        _cache_reduced_statistics(
+            statistics_reduced_manager,
+            reduced_cache_key,
+            period,
+            start_time,
+            end_time,
+            result,
+            generation,
+        )
+
     if "change" in _types:
         _augment_result_with_change(
             hass, session, start_time, units, _types, table, metadata, result
@@ -2232,14 +2368,20 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
+    if table == StatisticsShortTerm:
+        instance.statistics_short_term_manager.reset()
 
+    imported = False
     with session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
+    # The metadata may have been changed as well
+    instance.statistics_reduced_manager.reset()
+    return imported
 
 
 @retryable_database_job("adjust_statistics")
@@ -2251,6 +2393,7 @@ def adjust_statistics(
     adjustment_unit: str,
 ) -> bool:
     """Process an add_statistics job."""
+    instance.statistics_short_term_manager.reset()
 
     with session_scope(session=instance.get_session()) as session:
         metadata = instance.statistics_meta_manager.get_many(
@@ -2281,6 +2424,7 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    instance.statistics_reduced_manager.invalidate(start_time.replace(minute=0))
     return True
 
 
@@ -2314,6 +2458,7 @@ def change_statistics_unit(
     old_unit: str,
 ) -> None:
     """Change statistics unit for a statistic_id."""
+    instance.statistics_short_term_manager.reset()
     statistics_meta_manager = instance.statistics_meta_manager
     with session_scope(session=instance.get_session()) as session:
         metadata = statistics_meta_manager.get(session, statistic_id)
@@ -2349,6 +2494,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    instance.statistics_reduced_manager.reset()
+
 
 @callback
 def async_change_statistics_unit(
@@ -10,6 +10,7 @@ from homeassistant.core import HomeAssistant, callback
 from .. import get_instance
 from ..const import SupportedDialect
 from ..core import Recorder
+from ..purge import PurgeProgress
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -54,6 +55,17 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+def _format_purge_progress(purge_progress: PurgeProgress) -> str:
+    """Format the progress of the running purge."""
+    progress = (
+        f"{purge_progress.rows} rows purged"
+        f" ({purge_progress.rows_per_second:.0f} rows/s)"
+    )
+    if (remaining_seconds := purge_progress.remaining_seconds) is not None:
+        progress += f", about {remaining_seconds / 60:.0f} minutes remaining"
+    return progress
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -71,4 +83,8 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
+    if purge_progress := instance.purge_progress:
+        db_stats["purge_progress"] = _format_purge_progress(purge_progress)
+    if (hit_rate := instance.state_attributes_manager.cache_hit_rate) is not None:
+        db_stats["state_attributes_cache_hit_rate"] = f"{hit_rate:.1%}"
     return db_runs | db_stats | db_engine_info
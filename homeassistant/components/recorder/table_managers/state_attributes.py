@@ -1,10 +1,12 @@
 """Support managing StateAttributes."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
+from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
@@ -13,7 +15,11 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import (
+    find_latest_state_last_updated_ts,
+    find_shared_attributes_used_since,
+    get_shared_attributes,
+)
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -28,6 +34,10 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The attributes used by the states recorded in this many seconds
+# before the last recorded state are loaded into the cache at startup
+WARM_UP_WINDOW = 3600
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -42,6 +52,17 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         self.active = True  # always active
         self._exclude_attributes_by_domain = exclude_attributes_by_domain
         self._entity_sources = entity_sources(recorder.hass)
+        # Lookups resolved from the cache, and the ones that had to
+        # query the database, to measure the hit rate of the cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Return the share of the lookups resolved from the cache."""
+        if not (lookups := self.cache_hits + self.cache_misses):
+            return None
+        return self.cache_hits / lookups
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -73,6 +94,48 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_recently_used(self, session: Session) -> None:
+        """Load the attributes used before the recorder was restarted into memory.
+
+        Without this the cache starts empty and every state with
+        attributes not seen since the restart would need a query
+        to find its attributes_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (
+            latest_ts := session.execute(find_latest_state_last_updated_ts()).scalar()
+        ) is None:
+            return
+        lru: LRU = self._id_map
+        with session.no_autoflush:
+            rows = cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(
+                    session,
+                    find_shared_attributes_used_since(
+                        latest_ts - WARM_UP_WINDOW, lru.get_size()
+                    ),
+                    orm_rows=False,
+                ),
+            )
+        # The rows are the most recently used first, add them in reverse
+        # so the most recently used are the last to be evicted
+        for attributes_id, shared_attrs in reversed(rows):
+            lru[shared_attrs] = attributes_id
+        _LOGGER.debug("Loaded %s recently used attributes", len(lru))
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve shared_attrs to the attributes_id without accessing the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is not None:
+            self.cache_hits += 1
+        return attributes_id
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -97,9 +160,11 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
 
             results[shared_attrs] = attributes_id
 
+        self.cache_hits += len(results) - len(missing_hashes)
         if not missing_hashes:
             return results
 
+        self.cache_misses += len(missing_hashes)
         return results | self._load_from_hashes(missing_hashes, session)
 
     def _load_from_hashes(
@@ -1,8 +1,22 @@
 """Support managing States."""
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
+# The columns written by the multi-row insert, the primary key is
+# assigned by the database and returned by the insert.
+_INSERT_COLUMNS = tuple(
+    column.key for column in States.__table__.columns if column.key != "state_id"
+)
+_INSERT_STATES_RETURNING_IDS = insert(States).returning(
+    States.state_id, sort_by_parameter_order=True
+)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -11,6 +25,7 @@ class StatesManager:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
         self._last_committed_id: dict[str, int] = {}
+        self._pending_inserts: list[States] = []
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -43,6 +58,57 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to be written with insert_pending.
+
+        The state is not added to the session, it is written with
+        a multi-row insert right before the session is committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Write the states added with add_pending_insert.
+
+        The session must be flushed before calling this so the pending
+        StatesMeta and StateAttributes have been assigned their ids.
+
+        States are written in as few multi-row inserts as possible. A
+        state that links to an older state of the same entity that is
+        also pending starts a new insert since the state_id of the older
+        state is only known once it has been inserted.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending_inserts:
+            return
+        batch: list[States] = []
+        rows: list[dict[str, Any]] = []
+        batch_ids: set[int] = set()
+        for dbstate in self._pending_inserts:
+            if (old_state := dbstate.old_state) is not None and id(
+                old_state
+            ) in batch_ids:
+                self._insert_batch(session, batch, rows)
+                batch = []
+                rows = []
+                batch_ids = set()
+            batch.append(dbstate)
+            batch_ids.add(id(dbstate))
+            rows.append(_row_from_state(dbstate))
+        self._insert_batch(session, batch, rows)
+
+    def _insert_batch(
+        self, session: Session, batch: list[States], rows: list[dict[str, Any]]
+    ) -> None:
+        """Insert a batch of states and assign the returned state_ids."""
+        state_ids = session.scalars(_INSERT_STATES_RETURNING_IDS, rows)
+        for dbstate, state_id in zip(batch, state_ids, strict=True):
+            dbstate.state_id = state_id
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -52,6 +118,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +128,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -89,3 +157,15 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+
+
+def _row_from_state(dbstate: States) -> dict[str, Any]:
+    """Build the insert parameters for a state that is not in the session."""
+    row = {key: getattr(dbstate, key) for key in _INSERT_COLUMNS}
+    if (old_state := dbstate.old_state) is not None:
+        row["old_state_id"] = old_state.state_id
+    if (states_meta := dbstate.states_meta_rel) is not None:
+        row["metadata_id"] = states_meta.metadata_id
+    if (state_attributes := dbstate.state_attributes) is not None:
+        row["attributes_id"] = state_attributes.attributes_id
+    return row
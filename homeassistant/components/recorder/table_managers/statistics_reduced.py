@@ -0,0 +1,144 @@
+"""Support caching statistics reduced per day, week or month."""
+from __future__ import annotations
+
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+import threading
+from typing import TYPE_CHECKING
+
+from lru import LRU  # pylint: disable=no-name-in-module
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+    from ..statistics import StatisticsRow
+
+CACHE_SIZE = 64
+
+
+@dataclass(slots=True)
+class _ReducedPeriods:
+    """Statistics reduced for the periods between start_ts and end_ts."""
+
+    start_ts: float
+    end_ts: float
+    result: dict[str, list[StatisticsRow]]
+
+
+class StatisticsReducedManager:
+    """Cache the statistics reduced per day, week or month.
+
+    The same statistics are reduced from the hourly statistics every
+    time the energy dashboard is refreshed. Only the periods which
+    have ended are cached, so only the hourly statistics of the
+    current period have to be reduced again when the hour changes.
+
+    The cached periods are kept until statistics they may include are
+    compiled, imported or changed, or until the time zone the periods
+    are aligned to is changed.
+
+    This class is thread-safe since the statistics are read in the
+    database executor while they are changed in the recorder thread.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the reduced statistics manager."""
+        self.recorder = recorder
+        self._lock = threading.Lock()
+        self._cache: LRU = LRU(CACHE_SIZE)
+        self._generation = 0
+        self._time_zone: tzinfo = dt_util.DEFAULT_TIME_ZONE
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the cache.
+
+        The generation changes every time the cache is invalidated.
+        """
+        return self._generation
+
+    def get(
+        self, key: Hashable, start_ts: float, end_ts: float | None
+    ) -> tuple[float, dict[str, list[StatisticsRow]]] | None:
+        """Get the cached reduced statistics for key from start_ts.
+
+        Returns the end of the cached periods, which may be before
+        end_ts, and the reduced statistics until then.
+        """
+        with self._lock:
+            self._check_time_zone()
+            if (cached := self._cache.get(key)) is None or not (
+                cached.start_ts <= start_ts < cached.end_ts
+            ):
+                return None
+        cached_end_ts = cached.end_ts if end_ts is None else min(cached.end_ts, end_ts)
+        result: dict[str, list[StatisticsRow]] = {}
+        for statistic_id, rows in cached.result.items():
+            if statistic_rows := [
+                row.copy()
+                for row in rows
+                if start_ts <= row["start"] and row["end"] <= cached_end_ts
+            ]:
+                result[statistic_id] = statistic_rows
+        return cached_end_ts, result
+
+    def set(
+        self,
+        key: Hashable,
+        start_ts: float,
+        end_ts: float,
+        result: dict[str, list[StatisticsRow]],
+        generation: int,
+    ) -> None:
+        """Cache the statistics reduced for the periods from start_ts to end_ts.
+
+        The statistics are only cached if the cache was not invalidated
+        since generation, otherwise the result may be missing the changes
+        that invalidated the cache.
+        """
+        cached = _ReducedPeriods(
+            start_ts,
+            end_ts,
+            {
+                statistic_id: [row.copy() for row in rows if row["end"] <= end_ts]
+                for statistic_id, rows in result.items()
+            },
+        )
+        with self._lock:
+            self._check_time_zone()
+            if generation == self._generation:
+                self._cache[key] = cached
+
+    def _check_time_zone(self) -> None:
+        """Drop the cached periods if the time zone was changed.
+
+        Must be called with the lock held.
+        """
+        if (time_zone := dt_util.DEFAULT_TIME_ZONE) is not self._time_zone:
+            self._time_zone = time_zone
+            self._generation += 1
+            self._cache.clear()
+
+    def invalidate(self, start: datetime) -> None:
+        """Invalidate the cached statistics which may include start or later.
+
+        Must be called after the changed statistics have been committed.
+        """
+        start_ts = start.timestamp()
+        with self._lock:
+            self._generation += 1
+            for key in [
+                key for key, cached in self._cache.items() if cached.end_ts > start_ts
+            ]:
+                del self._cache[key]
+
+    def reset(self) -> None:
+        """Invalidate all cached statistics.
+
+        Must be called after the changed statistics have been committed.
+        """
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
@@ -0,0 +1,163 @@
+"""Support managing StatisticsShortTerm."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from ..models import (
+    StatisticData,
+    StatisticDataTimestamp,
+    datetime_to_timestamp_or_none,
+)
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+PERIOD_SIZE = timedelta(minutes=5)
+PERIODS_PER_HOUR = 12
+
+
+class StatisticsShortTermManager:
+    """Manage the short term statistics compiled during the current hour.
+
+    The 5-minute statistics compiled by the recorder are kept in memory
+    until the hour is complete so the hourly statistics can be summarized
+    without querying the statistics_short_term table again.
+
+    If the recorder was restarted, a period was not compiled by this
+    process or the short term statistics were changed outside of
+    compiling them, the summary is not available and the caller must
+    fall back to summarizing the table.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the short term statistics manager."""
+        self.recorder = recorder
+        self._hour_start_ts: float | None = None
+        self._periods: dict[float, dict[int, StatisticData]] = {}
+        self._pending: tuple[float, dict[int, StatisticData]] | None = None
+
+    def add_pending(self, start: datetime, stats: dict[int, StatisticData]) -> None:
+        """Add the statistics compiled for a 5-minute period.
+
+        The period is only used for summarizing the hour once it
+        has been committed with `commit_pending`.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending = (start.timestamp(), stats)
+
+    def commit_pending(self) -> None:
+        """Call after the pending period has been committed to the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._pending is None:
+            return
+        start_ts, stats = self._pending
+        self._pending = None
+        hour_start_ts = start_ts - start_ts % 3600
+        if hour_start_ts != self._hour_start_ts:
+            self._periods.clear()
+            self._hour_start_ts = hour_start_ts
+        self._periods[start_ts] = stats
+
+    def discard_pending(self) -> None:
+        """Discard the pending period, if any.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending = None
+
+    def get_hourly_summary(
+        self, start: datetime
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Summarize the hour ending with the pending period starting at start.
+
+        Returns None if not every 5-minute period of the hour is known.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._pending is None:
+            return None
+        start_ts, last_period_stats = self._pending
+        hour_start_ts = start_ts - start_ts % 3600
+        if start_ts != start.timestamp() or hour_start_ts != self._hour_start_ts:
+            return None
+        period_starts = [
+            hour_start_ts + idx * PERIOD_SIZE.total_seconds()
+            for idx in range(PERIODS_PER_HOUR - 1)
+        ]
+        if len(self._periods) != len(period_starts) or not all(
+            period_start in self._periods for period_start in period_starts
+        ):
+            return None
+
+        means: dict[int, list[float]] = {}
+        mins: dict[int, list[float]] = {}
+        maxs: dict[int, list[float]] = {}
+        # The sum is taken from the last 5-minute period of the hour
+        last_stats: dict[int, StatisticData] = {}
+        for period_stats in (
+            *(self._periods[period_start] for period_start in period_starts),
+            last_period_stats,
+        ):
+            for metadata_id, stat in period_stats.items():
+                if metadata_id not in last_stats:
+                    means[metadata_id] = []
+                    mins[metadata_id] = []
+                    maxs[metadata_id] = []
+                if (_mean := stat.get("mean")) is not None:
+                    means[metadata_id].append(_mean)
+                if (_min := stat.get("min")) is not None:
+                    mins[metadata_id].append(_min)
+                if (_max := stat.get("max")) is not None:
+                    maxs[metadata_id].append(_max)
+                last_stats[metadata_id] = stat
+
+        summary: dict[int, StatisticDataTimestamp] = {}
+        for metadata_id, last_stat in last_stats.items():
+            summary_item: StatisticDataTimestamp = {
+                "start_ts": hour_start_ts,
+                "last_reset_ts": datetime_to_timestamp_or_none(
+                    last_stat.get("last_reset")
+                ),
+            }
+            if metadata_means := means[metadata_id]:
+                summary_item["mean"] = sum(metadata_means) / len(metadata_means)
+            if metadata_mins := mins[metadata_id]:
+                summary_item["min"] = min(metadata_mins)
+            if metadata_maxs := maxs[metadata_id]:
+                summary_item["max"] = max(metadata_maxs)
+            if (state := last_stat.get("state")) is not None:
+                summary_item["state"] = state
+            if (_sum := last_stat.get("sum")) is not None:
+                summary_item["sum"] = _sum
+            summary[metadata_id] = summary_item
+        return summary
+
+    def discard_before(self, purge_before: datetime) -> None:
+        """Discard the current hour if rows before purge_before were purged.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (
+            self._hour_start_ts is not None
+            and self._hour_start_ts < purge_before.timestamp()
+        ):
+            self.reset()
+
+    def reset(self) -> None:
+        """Reset after the short term statistics have been changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._hour_start_ts = None
+        self._periods.clear()
+        self._pending = None
@@ -16,6 +16,7 @@ from homeassistant.util.json import JsonValueType
 
 from .connection import ActiveConnection
 from .error import Disconnect
+from .messages import StateDiffMessage
 
 if TYPE_CHECKING:
     from .http import WebSocketAdapter
@@ -57,7 +58,7 @@ class AuthPhase:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[[str | dict[str, Any] | StateDiffMessage], None],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
     ) -> None:
@@ -303,7 +303,9 @@ def _send_handle_get_states_response(
 
 
 def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    send_message: Callable[
+        [str | dict[str, Any] | Callable[[], str] | messages.StateDiffMessage], None
+    ],
     entity_ids: set[str],
     user: User,
     msg_id: int,
@@ -320,7 +322,7 @@ def _forward_entity_changes(
         POLICY_READ
     ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
         return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    send_message(messages.StateDiffMessage(msg_id, event))
 
 
 @callback
@@ -21,6 +21,9 @@ DOMAIN: Final = "websocket_api"
 URL: Final = "/api/websocket"
 PENDING_MSG_PEAK: Final = 1024
 PENDING_MSG_PEAK_TIME: Final = 5
+# When more messages than this are pending, state diffs for the same
+# entity are merged while they wait to be sent to a slow client.
+PENDING_MSG_MERGE_STATE_DIFFS: Final = 128
 # Maximum number of messages that can be pending at any given time.
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
@@ -21,6 +21,7 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_MERGE_STATE_DIFFS,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -28,7 +29,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import StateDiffMessage, message_to_json
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -75,6 +76,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_queued_state_diffs",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -94,8 +96,11 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | StateDiffMessage | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # State diffs waiting in the message queue by subscription
+        # and entity_id so they can be merged for slow clients
+        self._queued_state_diffs: dict[tuple[int, str], StateDiffMessage] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -137,6 +142,8 @@ class WebSocketHandler:
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
+                if isinstance(message, StateDiffMessage):
+                    message = self._state_diff_message_to_json(message)
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
@@ -156,6 +163,8 @@ class WebSocketHandler:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
+                    if isinstance(message, StateDiffMessage):
+                        message = self._state_diff_message_to_json(message)
                     messages.append(message)
                     messages_remaining -= 1
 
@@ -174,6 +183,11 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _state_diff_message_to_json(self, message: StateDiffMessage) -> str:
+        """Serialize a queued state diff message that can no longer be merged."""
+        del self._queued_state_diffs[(message.iden, message.entity_id)]
+        return message.as_json()
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -182,11 +196,14 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(self, message: str | dict[str, Any] | StateDiffMessage) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
 
+        State diffs are merged with a queued state diff of the same
+        entity when the client is falling behind.
+
         Async friendly.
         """
         if self._closing:
@@ -194,11 +211,18 @@ class WebSocketHandler:
             # max pending messages.
             return
 
-        if isinstance(message, dict):
-            message = message_to_json(message)
-
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
+
+        if isinstance(message, dict):
+            message = message_to_json(message)
+        elif isinstance(message, StateDiffMessage):
+            key = (message.iden, message.entity_id)
+            if queued_state_diff := self._queued_state_diffs.get(key):
+                queued_state_diff.merge(message)
+                return
+            if queue_size_before_add < PENDING_MSG_MERGE_STATE_DIFFS:
+                message = message.as_json()
         if queue_size_before_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -214,6 +238,8 @@ class WebSocketHandler:
             return
 
         message_queue.append(message)
+        if isinstance(message, StateDiffMessage):
+            self._queued_state_diffs[(message.iden, message.entity_id)] = message
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
@@ -458,6 +484,7 @@ class WebSocketHandler:
                     self._hass = None  # type: ignore[assignment]
                     self._logger = None  # type: ignore[assignment]
                     self._message_queue = None  # type: ignore[assignment]
+                    self._queued_state_diffs = None  # type: ignore[assignment]
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
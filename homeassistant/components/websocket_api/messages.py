@@ -1,9 +1,10 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from contextlib import suppress
 from functools import lru_cache
 import logging
-from typing import TYPE_CHECKING, Any, Final, cast
+from typing import Any, Final
 
 import voluptuous as vol
 
@@ -116,11 +117,60 @@ def _cached_state_diff_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    event_data = event.data
+    if event_data["old_state"] is None and event_data["new_state"] is not None:
+        # Added states reuse the compressed state JSON cached on the State
+        # which is also used by subscribe_entities to send the initial states
+        new_state: State = event_data["new_state"]
+        with suppress(ValueError, TypeError):
+            return (
+                f'{{"id":{IDEN_JSON_TEMPLATE},"type":"event","event":'
+                f'{{"{ENTITY_EVENT_ADD}":{{{new_state.as_compressed_state_json()}}}}}}}'
+            )
     return message_to_json(
         {"id": IDEN_TEMPLATE, "type": "event", "event": _state_diff_event(event)}
     )
 
 
+class StateDiffMessage:
+    """A state diff of a subscribe_entities subscription waiting to be sent.
+
+    While the message is queued for a slow client, later state changes of
+    the same entity are merged into it so only the diff to the latest state
+    is sent.
+    """
+
+    __slots__ = ("iden", "entity_id", "event", "old_state", "new_state")
+
+    def __init__(self, iden: int, event: Event) -> None:
+        """Initialize the state diff message."""
+        self.iden = iden
+        self.entity_id: str = event.data["entity_id"]
+        self.event: Event | None = event
+        self.old_state: State | None = event.data["old_state"]
+        self.new_state: State | None = event.data["new_state"]
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<StateDiffMessage {self.iden} {self.entity_id}>"
+
+    def merge(self, message: StateDiffMessage) -> None:
+        """Merge a later state diff message of the same entity."""
+        self.event = None
+        self.new_state = message.new_state
+
+    def as_json(self) -> str:
+        """Serialize the message to json."""
+        if self.event is not None:
+            return cached_state_diff_message(self.iden, self.event)
+        return message_to_json(
+            event_message(
+                self.iden,
+                _state_diff_states(self.entity_id, self.old_state, self.new_state),
+            )
+        )
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -132,19 +182,20 @@ def _state_diff_event(event: Event) -> dict:
         "r": [entity_id,…]
     }
     """
-    if (event_new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if TYPE_CHECKING:
-        event_new_state = cast(State, event_new_state)
-    if (event_old_state := event.data["old_state"]) is None:
-        return {
-            ENTITY_EVENT_ADD: {
-                event_new_state.entity_id: event_new_state.as_compressed_state()
-            }
-        }
-    if TYPE_CHECKING:
-        event_old_state = cast(State, event_old_state)
-    return _state_diff(event_old_state, event_new_state)
+    return _state_diff_states(
+        event.data["entity_id"], event.data["old_state"], event.data["new_state"]
+    )
+
+
+def _state_diff_states(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict:
+    """Convert an old and new state to the minimal version."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
+        return {ENTITY_EVENT_ADD: {entity_id: new_state.as_compressed_state()}}
+    return _state_diff(old_state, new_state)
 
 
 def _state_diff(
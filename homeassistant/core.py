@@ -1038,12 +1038,51 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
+        self._async_dispatch(
+            Event(event_type, event_data, origin, time_fired, context),
+            _LOGGER.isEnabledFor(logging.DEBUG),
+        )
+
+    @callback
+    def _async_fire_many(
+        self,
+        event_type: str,
+        events_data: Iterable[dict[str, Any]],
+        origin: EventOrigin,
+        context: Context,
+        time_fired: datetime.datetime,
+    ) -> None:
+        """Fire multiple events of the same type, origin, context and time.
+
+        The event type is validated once and each event is dispatched
+        to the listeners registered at the time it is fired, the same
+        as calling async_fire for every event.
+
+        This method must be run in the event loop.
+        """
+        if len(event_type) > MAX_LENGTH_EVENT_EVENT_TYPE:
+            raise MaxLengthExceeded(
+                event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
+            )
+
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        for event_data in events_data:
+            self._async_dispatch(
+                Event(event_type, event_data, origin, time_fired, context),
+                debug_enabled,
+            )
+
+    @callback
+    def _async_dispatch(self, event: Event, debug_enabled: bool) -> None:
+        """Dispatch an event to its listeners.
+
+        This method must be run in the event loop.
+        """
+        event_type = event.event_type
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
 
-        event = Event(event_type, event_data, origin, time_fired, context)
-
-        if _LOGGER.isEnabledFor(logging.DEBUG):
+        if debug_enabled:
             _LOGGER.debug("Bus:Handling %s", event)
 
         if not listeners and not match_all_listeners:
@@ -1619,16 +1658,11 @@ class StateMachine:
         entity_id = entity_id.lower()
         new_state = str(new_state)
         attributes = attributes or {}
-        if (old_state := self._states.get(entity_id)) is None:
-            same_state = False
-            same_attr = False
-            last_changed = None
-        else:
-            same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        if same_state and same_attr:
+        old_state = self._states.get(entity_id)
+        changed, last_changed = _state_changed(
+            old_state, new_state, attributes, force_update
+        )
+        if not changed:
             return
 
         if context is None:
@@ -1658,13 +1692,7 @@ class StateMachine:
             context,
             old_state is None,
         )
-        if old_state is not None:
-            old_state.expire()
-        self._states[entity_id] = state
-        if not (domain_index := self._domain_index.get(state.domain)):
-            domain_index = {}
-            self._domain_index[state.domain] = domain_index
-        domain_index[entity_id] = state
+        self._async_store_state(old_state, state)
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1673,6 +1701,114 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None, bool]],
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities that do not exist.
+
+        states is an iterable of (entity_id, state, attributes, force_update)
+        tuples which are handled the same way as calls to async_set. If an
+        entity_id occurs more than once, the last state and attributes are
+        used and the update is forced if any of the entries forces it.
+
+        All changed states share the same last_updated timestamp and context.
+        The state machine is updated for all entities before any state_changed
+        event is fired. If any of the states is invalid, no state is set.
+
+        This method must be run in the event loop.
+        """
+        merged: dict[str, tuple[str, Mapping[str, Any], bool]] = {}
+        for entity_id, new_state, attributes, force_update in states:
+            entity_id = entity_id.lower()
+            if (previous := merged.get(entity_id)) is not None:
+                force_update = force_update or previous[2]
+            merged[entity_id] = (str(new_state), attributes or {}, force_update)
+
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        current_states = self._states
+        changes: list[tuple[State | None, State]] = []
+        for entity_id, (new_state, attributes, force_update) in merged.items():
+            old_state = current_states.get(entity_id)
+            changed, last_changed = _state_changed(
+                old_state, new_state, attributes, force_update
+            )
+            if not changed:
+                continue
+            changes.append(
+                (
+                    old_state,
+                    State(
+                        entity_id,
+                        new_state,
+                        attributes,
+                        last_changed,
+                        now,
+                        context,
+                        old_state is None,
+                    ),
+                )
+            )
+
+        if not changes:
+            return
+
+        for old_state, state in changes:
+            self._async_store_state(old_state, state)
+
+        self._bus._async_fire_many(  # pylint: disable=protected-access
+            EVENT_STATE_CHANGED,
+            (
+                {
+                    "entity_id": state.entity_id,
+                    "old_state": old_state,
+                    "new_state": state,
+                }
+                for old_state, state in changes
+            ),
+            EventOrigin.local,
+            context,
+            now,
+        )
+
+    @callback
+    def _async_store_state(self, old_state: State | None, state: State) -> None:
+        """Replace old_state with state in the state machine.
+
+        This method must be run in the event loop.
+        """
+        if old_state is not None:
+            old_state.expire()
+        entity_id = state.entity_id
+        self._states[entity_id] = state
+        if not (domain_index := self._domain_index.get(state.domain)):
+            domain_index = {}
+            self._domain_index[state.domain] = domain_index
+        domain_index[entity_id] = state
+
+
+def _state_changed(
+    old_state: State | None,
+    new_state: str,
+    attributes: Mapping[str, Any],
+    force_update: bool,
+) -> tuple[bool, datetime.datetime | None]:
+    """Return if a state should be written and the last_changed to keep.
+
+    last_changed is None when it should be set to last_updated.
+    """
+    if old_state is None:
+        return True, None
+    if old_state.state == new_state and not force_update:
+        return old_state.attributes != attributes, old_state.last_changed
+    return True, None
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -178,6 +178,45 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of multiple entities to the state machine at once.
+
+    This is intended for integrations that update many entities from a
+    single message. The states share one timestamp and context and are
+    dispatched in one pass through StateMachine.async_set_many. Entities
+    that have a context set are written individually to keep their context.
+
+    Platforms should use EntityPlatform.async_write_ha_states, this is for
+    entity components writing the entities of all their platforms, like
+    the access token rotation of camera and image.
+    """
+    # pylint: disable=protected-access
+    batch: list[tuple[Entity, str, dict[str, Any]]] = []
+    for entity in entities:
+        entity._async_verify_state_writable()
+        if (calculated_state := entity._async_calculate_state()) is None:
+            continue
+        if entity._context is not None:
+            entity._async_set_state(*calculated_state)
+            continue
+        batch.append((entity, *calculated_state))
+
+    if not batch:
+        return
+
+    try:
+        hass.states.async_set_many(
+            (entity.entity_id, state, attr, entity.force_update)
+            for entity, state, attr in batch
+        )
+    except InvalidStateError:
+        # Set the states one by one so only the invalid
+        # states fall back to unknown
+        for entity, state, attr in batch:
+            entity._async_set_state(state, attr)
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -703,6 +742,12 @@ class Entity(ABC):
     @callback
     def async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        self._async_verify_state_writable()
+        self._async_write_ha_state()
+
+    @callback
+    def _async_verify_state_writable(self) -> None:
+        """Verify the entity is in a writable state."""
         if self.hass is None:
             raise RuntimeError(f"Attribute hass is None for {self}")
 
@@ -727,8 +772,6 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
-        self._async_write_ha_state()
-
     def _stringify_state(self, available: bool) -> str:
         """Convert state to string."""
         if not available:
@@ -806,9 +849,18 @@ class Entity(ABC):
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (calculated_state := self._async_calculate_state()) is not None:
+            self._async_set_state(*calculated_state)
+
+    @callback
+    def _async_calculate_state(self) -> tuple[str, dict[str, Any]] | None:
+        """Calculate the state and attributes to write to the state machine.
+
+        Returns None if the state should not be written.
+        """
         if self._platform_state == EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -824,7 +876,7 @@ class Entity(ABC):
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         start = timer()
         state, attr = self._async_generate_attributes()
@@ -853,6 +905,13 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
+        return (state, attr)
+
+    @callback
+    def _async_set_state(self, state: str, attr: dict[str, Any]) -> None:
+        """Set a calculated state in the state machine."""
+        hass = self.hass
+        entity_id = self.entity_id
         try:
             hass.states.async_set(
                 entity_id, state, attr, self.force_update, self._context
@@ -38,6 +38,7 @@ from . import (
     service,
     translation,
 )
+from .entity import async_write_ha_states
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later, async_track_time_interval
 from .issue_registry import IssueSeverity, async_create_issue
@@ -794,6 +795,20 @@ class EntityPlatform:
             self._async_unsub_polling()
             self._async_unsub_polling = None
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity] | None = None) -> None:
+        """Write the states of entities of the platform at once.
+
+        This is intended for integrations which update many entities from a
+        single message or poll, like a hub pushing the state of all its
+        devices. The states share one timestamp and context and are
+        dispatched in one pass. Writes the states of all entities of the
+        platform if entities is not set.
+        """
+        async_write_ha_states(
+            self.hass, self.entities.values() if entities is None else entities
+        )
+
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> list[Entity]:
@@ -433,9 +433,11 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains four additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> dict[key, True]
+    - area_id -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -443,6 +445,8 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -451,19 +455,29 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
         if key in self:
-            old_entry = self[key]
-            del self._entry_ids[old_entry.id]
-            del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self._unindex_entry(key)
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if (device_id := entry.device_id) is not None:
+            self._device_id_index.setdefault(device_id, {})[key] = True
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index.setdefault(area_id, {})[key] = True
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
+        self._unindex_entry(key)
+        super().__delitem__(key)
+
+    def _unindex_entry(self, key: str) -> None:
+        """Remove an item from the indexes."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        super().__delitem__(key)
+        if (device_id := entry.device_id) is not None:
+            _remove_from_index(self._device_id_index, device_id, key)
+        if (area_id := entry.area_id) is not None:
+            _remove_from_index(self._area_id_index, area_id, key)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -473,6 +487,32 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [
+            entry
+            for key in self._device_id_index.get(device_id, ())
+            if not (entry := data[key]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+
+def _remove_from_index(
+    index: dict[str, dict[str, Literal[True]]], index_key: str, key: str
+) -> None:
+    """Remove a key from an index, dropping the index entry once it is empty."""
+    keys = index[index_key]
+    del keys[key]
+    if not keys:
+        del index[index_key]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -1208,12 +1248,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -1221,7 +1258,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -10,7 +10,7 @@ import functools as ft
 import logging
 from random import randint
 import time
-from typing import Any, Concatenate, ParamSpec, TypedDict, TypeVar
+from typing import Any, Concatenate, Generic, ParamSpec, TypedDict, TypeVar
 
 import attr
 
@@ -126,6 +126,21 @@ class TrackTemplateResult:
     result: Any
 
 
+@dataclass(slots=True)
+class TrackTemplateRenderStats:
+    """Class for counting state changes considered for a tracked template.
+
+    skipped
+        State changes that did not re-render the template because nothing
+        the template read during the last render has changed.
+    rendered
+        State changes that re-rendered the template.
+    """
+
+    skipped: int = 0
+    rendered: int = 0
+
+
 class EventStateChangedData(TypedDict):
     """EventStateChanged data."""
 
@@ -279,14 +294,45 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
+@dataclass(slots=True, frozen=True)
+class _KeyedEventTracker(Generic[_TypedDictT]):
+    """Class to track events by key.
+
+    All listeners of a tracker share a single bus listener and are
+    routed with a dict lookup on the key, so dispatching an event
+    only costs the number of listeners interested in its key.
+    """
+
+    callbacks_key: str
+    listeners_key: str
+    event_type: str
+    dispatcher_callable: Callable[
+        [
+            HomeAssistant,
+            dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
+            EventType[_TypedDictT],
+        ],
+        None,
+    ]
+    filter_callable: Callable[
+        [
+            HomeAssistant,
+            dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
+            EventType[_TypedDictT],
+        ],
+        bool,
+    ]
+
+
 @callback
-def _async_dispatch_entity_id_event(
+def _async_dispatch_keyed_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
+    key: str,
+    callbacks: dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
+    event: EventType[_TypedDictT],
 ) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
+    """Dispatch an event to the listeners of key."""
+    if not (callbacks_list := callbacks.get(key)):
         return
     for job in callbacks_list[:]:
         try:
@@ -294,11 +340,21 @@ def _async_dispatch_entity_id_event(
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception(
                 "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
+                key,
                 job,
             )
 
 
+@callback
+def _async_dispatch_entity_id_event(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    event: EventType[EventStateChangedData],
+) -> None:
+    """Dispatch to listeners."""
+    _async_dispatch_keyed_event(hass, event.data["entity_id"], callbacks, event)
+
+
 @callback
 def _async_state_change_filter(
     hass: HomeAssistant,
@@ -309,6 +365,15 @@ def _async_state_change_filter(
     return event.data["entity_id"] in callbacks
 
 
+_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
+    callbacks_key=TRACK_STATE_CHANGE_CALLBACKS,
+    listeners_key=TRACK_STATE_CHANGE_LISTENER,
+    event_type=EVENT_STATE_CHANGED,
+    dispatcher_callable=_async_dispatch_entity_id_event,
+    filter_callable=_async_state_change_filter,
+)
+
+
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
@@ -316,16 +381,7 @@ def _async_track_state_change_event(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_STATE_CHANGE_CALLBACKS,
-        TRACK_STATE_CHANGE_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
-        action,
-    )
+    return _async_track_event(_KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action)
 
 
 @callback
@@ -353,27 +409,9 @@ def _remove_listener(
 
 
 def _async_track_event(
+    tracker: _KeyedEventTracker[_TypedDictT],
     hass: HomeAssistant,
     keys: str | Iterable[str],
-    callbacks_key: str,
-    listeners_key: str,
-    event_type: str,
-    dispatcher_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
-            EventType[_TypedDictT],
-        ],
-        None,
-    ],
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
-            EventType[_TypedDictT],
-        ],
-        bool,
-    ],
     action: Callable[[EventType[_TypedDictT]], None],
 ) -> CALLBACK_TYPE:
     """Track an event by a specific key."""
@@ -384,6 +422,7 @@ def _async_track_event(
         keys = [keys]
 
     hass_data = hass.data
+    callbacks_key = tracker.callbacks_key
 
     callbacks: dict[
         str, list[HassJob[[EventType[_TypedDictT]], Any]]
@@ -391,14 +430,15 @@ def _async_track_event(
     if not callbacks:
         callbacks = hass_data[callbacks_key] = {}
 
+    listeners_key = tracker.listeners_key
     if listeners_key not in hass_data:
         hass_data[listeners_key] = hass.bus.async_listen(
-            event_type,
-            callback(ft.partial(dispatcher_callable, hass, callbacks)),
-            event_filter=callback(ft.partial(filter_callable, hass, callbacks)),
+            tracker.event_type,
+            callback(ft.partial(tracker.dispatcher_callable, hass, callbacks)),
+            event_filter=callback(ft.partial(tracker.filter_callable, hass, callbacks)),
         )
 
-    job = HassJob(action, f"track {event_type} event {keys}")
+    job = HassJob(action, f"track {tracker.event_type} event {keys}")
 
     for key in keys:
         callback_list = callbacks.get(key)
@@ -419,21 +459,12 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
     event: EventType[EventEntityRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
+    _async_dispatch_keyed_event(
+        hass,
+        event.data.get("old_entity_id", event.data["entity_id"]),  # type: ignore[arg-type]  # mypy bug?
+        callbacks,
+        event,
+    )
 
 
 @callback
@@ -448,6 +479,15 @@ def _async_entity_registry_updated_filter(
     return event.data.get("old_entity_id", event.data["entity_id"]) in callbacks
 
 
+_KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
+    callbacks_key=TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
+    listeners_key=TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
+    event_type=EVENT_ENTITY_REGISTRY_UPDATED,
+    dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
+    filter_callable=_async_entity_registry_updated_filter,
+)
+
+
 @bind_hass
 @callback
 def async_track_entity_registry_updated_event(
@@ -462,14 +502,7 @@ def async_track_entity_registry_updated_event(
     Similar to async_track_state_change_event.
     """
     return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
-        TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
-        EVENT_ENTITY_REGISTRY_UPDATED,
-        _async_dispatch_old_entity_id_or_entity_id_event,
-        _async_entity_registry_updated_filter,
-        action,
+        _KEYED_TRACK_ENTITY_REGISTRY_UPDATED, hass, entity_ids, action
     )
 
 
@@ -494,17 +527,16 @@ def _async_dispatch_device_id_event(
     event: EventType[EventDeviceRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
+    _async_dispatch_keyed_event(hass, event.data["device_id"], callbacks, event)
+
+
+_KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
+    callbacks_key=TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS,
+    listeners_key=TRACK_DEVICE_REGISTRY_UPDATED_LISTENER,
+    event_type=EVENT_DEVICE_REGISTRY_UPDATED,
+    dispatcher_callable=_async_dispatch_device_id_event,
+    filter_callable=_async_device_registry_updated_filter,
+)
 
 
 @callback
@@ -518,14 +550,7 @@ def async_track_device_registry_updated_event(
     Similar to async_track_entity_registry_updated_event.
     """
     return _async_track_event(
-        hass,
-        device_ids,
-        TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS,
-        TRACK_DEVICE_REGISTRY_UPDATED_LISTENER,
-        EVENT_DEVICE_REGISTRY_UPDATED,
-        _async_dispatch_device_id_event,
-        _async_device_registry_updated_filter,
-        action,
+        _KEYED_TRACK_DEVICE_REGISTRY_UPDATED, hass, device_ids, action
     )
 
 
@@ -559,6 +584,15 @@ def _async_domain_added_filter(
     )
 
 
+_KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
+    callbacks_key=TRACK_STATE_ADDED_DOMAIN_CALLBACKS,
+    listeners_key=TRACK_STATE_ADDED_DOMAIN_LISTENER,
+    event_type=EVENT_STATE_CHANGED,
+    dispatcher_callable=_async_dispatch_domain_event,
+    filter_callable=_async_domain_added_filter,
+)
+
+
 @bind_hass
 def async_track_state_added_domain(
     hass: HomeAssistant,
@@ -578,16 +612,7 @@ def _async_track_state_added_domain(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is added to domains."""
-    return _async_track_event(
-        hass,
-        domains,
-        TRACK_STATE_ADDED_DOMAIN_CALLBACKS,
-        TRACK_STATE_ADDED_DOMAIN_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_domain_event,
-        _async_domain_added_filter,
-        action,
-    )
+    return _async_track_event(_KEYED_TRACK_STATE_ADDED_DOMAIN, hass, domains, action)
 
 
 @callback
@@ -603,6 +628,15 @@ def _async_domain_removed_filter(
     )
 
 
+_KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
+    callbacks_key=TRACK_STATE_REMOVED_DOMAIN_CALLBACKS,
+    listeners_key=TRACK_STATE_REMOVED_DOMAIN_LISTENER,
+    event_type=EVENT_STATE_CHANGED,
+    dispatcher_callable=_async_dispatch_domain_event,
+    filter_callable=_async_domain_removed_filter,
+)
+
+
 @bind_hass
 def async_track_state_removed_domain(
     hass: HomeAssistant,
@@ -610,16 +644,7 @@ def async_track_state_removed_domain(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is removed from domains."""
-    return _async_track_event(
-        hass,
-        domains,
-        TRACK_STATE_REMOVED_DOMAIN_CALLBACKS,
-        TRACK_STATE_REMOVED_DOMAIN_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_domain_event,
-        _async_domain_removed_filter,
-        action,
-    )
+    return _async_track_event(_KEYED_TRACK_STATE_REMOVED_DOMAIN, hass, domains, action)
 
 
 @callback
@@ -905,6 +930,10 @@ class TrackTemplateResultInfo:
         self._has_super_template = has_super_template
 
         self._last_result: dict[Template, bool | str | TemplateError] = {}
+        self._render_stats: dict[Template, TrackTemplateRenderStats] = {
+            track_template_.template: TrackTemplateRenderStats()
+            for track_template_ in track_templates
+        }
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
@@ -986,6 +1015,11 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def render_stats(self) -> dict[Template, TrackTemplateRenderStats]:
+        """State changes that did or did not re-render each template."""
+        return self._render_stats
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1054,6 +1088,10 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if not _event_changes_observed_state(event, info):
+                self._render_stats[template].skipped += 1
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1067,6 +1105,7 @@ class TrackTemplateResultInfo:
             ):
                 return not had_timer
 
+            self._render_stats[template].rendered += 1
             _LOGGER.debug(
                 "Template update %s triggered by event: %s",
                 template.template,
@@ -1792,6 +1831,33 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _event_changes_observed_state(
+    event: EventType[EventStateChangedData], info: RenderInfo
+) -> bool:
+    """Determine if an event changes what the template read during the last render.
+
+    When only the state of the entity was read, and the entity is not
+    also tracked by its domain, a change that keeps the state the same
+    cannot change the result of the template.
+    """
+    entity_id = event.data["entity_id"]
+
+    if (
+        info.all_states
+        or info.exception
+        or (observed_state := info.entity_states.get(entity_id)) is None
+        or (old_state := event.data["old_state"]) is None
+        or (new_state := event.data["new_state"]) is None
+        or split_entity_id(entity_id)[0] in info.domains
+    ):
+        return True
+
+    # The old state is compared as well since the same template
+    # may be tracked more than once and already re-rendered
+    return not old_state.state == new_state.state == observed_state
+
+
 @callback
 def _rate_limit_for_event(
     event: EventType[EventStateChangedData],
@@ -151,15 +151,13 @@ def _orjson_default_encoder(data: Any) -> str:
     ).decode("utf-8")
 
 
-def save_json(
+def prepare_save_json(
     filename: str,
     data: list | dict,
-    private: bool = False,
     *,
     encoder: type[json.JSONEncoder] | None = None,
-    atomic_writes: bool = False,
-) -> None:
-    """Save JSON data to a file."""
+) -> str:
+    """Prepare JSON data to be saved to a file."""
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -180,7 +178,19 @@ def save_json(
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {formatted_data}"
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
+    return json_data
+
 
+def save_json(
+    filename: str,
+    data: list | dict,
+    private: bool = False,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+    atomic_writes: bool = False,
+) -> None:
+    """Save JSON data to a file."""
+    json_data = prepare_save_json(filename, data, encoder=encoder)
     if atomic_writes:
         write_utf8_file_atomic(filename, json_data, private)
     else:
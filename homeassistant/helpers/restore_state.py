@@ -6,6 +6,8 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+import orjson
+
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -78,6 +80,26 @@ class StoredState:
         }
         return result
 
+    def as_dump_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state to dump.
+
+        The state is included as the JSON it is cached as by the state
+        object, so only states which changed since the last dump have to
+        be encoded again. Encoding may block, this must not be called from
+        the event loop.
+        """
+        state: Any
+        try:
+            state = orjson.Fragment(self.state.as_dict_json())
+        except TypeError:
+            # Leave reporting the unserializable data to the store
+            state = self.state.as_dict()
+        return {
+            "state": state,
+            "extra_data": self.extra_data.as_dict() if self.extra_data else None,
+            "last_seen": self.last_seen,
+        }
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Self:
         """Initialize a stored state from a dict."""
@@ -214,12 +236,12 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                await self.hass.async_add_executor_job(
+                    _dump_stored_states, stored_states
+                )
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -305,6 +327,15 @@ def _encode_complex(value: Any) -> Any:
     return _encode_complex(new_value)
 
 
+def _dump_stored_states(stored_states: list[StoredState]) -> list[dict[str, Any]]:
+    """Return the stored states to dump.
+
+    This is run in the executor as the states which changed since the last
+    dump have to be encoded.
+    """
+    return [stored_state.as_dump_dict() for stored_state in stored_states]
+
+
 class RestoreEntity(Entity):
     """Mixin class for restoring previous entity state."""
 
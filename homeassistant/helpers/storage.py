@@ -5,10 +5,12 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
+import time
 from typing import Any, Generic, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
@@ -24,7 +26,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 
 from . import json as json_helper
 
@@ -109,6 +111,7 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._written_data_hash: bytes | None = None
 
     @property
     def path(self):
@@ -357,16 +360,30 @@ class Store(Generic[_T]):
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
     def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
+        """Write the data.
+
+        The file is not rewritten if the data is the same as written last.
+        """
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        json_data = json_helper.prepare_save_json(path, data, encoder=self._encoder)
+        data_hash = hashlib.sha256(json_data.encode("utf-8")).digest()
+        if data_hash == self._written_data_hash and os.path.exists(path):
+            _LOGGER.debug("Data for %s is unchanged, not writing %s", self.key, path)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+        start = time.monotonic()
+        if self._atomic_writes:
+            write_utf8_file_atomic(path, json_data, self._private)
+        else:
+            write_utf8_file(path, json_data, self._private)
+        self._written_data_hash = data_hash
+        _LOGGER.debug(
+            "Wrote %s characters for %s in %.3f seconds",
+            len(json_data),
+            self.key,
+            time.monotonic() - start,
         )
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
@@ -377,6 +394,7 @@ class Store(Generic[_T]):
         """Remove all data."""
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._written_data_hash = None
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
@@ -340,6 +340,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_states",
         "rate_limit",
         "has_time",
     )
@@ -358,6 +359,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The state of entities where only the state was read during the
+        # render, or None if anything else about the entity was read
+        self.entity_states: dict[str, str | None] = {}
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -948,6 +952,7 @@ class TemplateStateBase(State):
     def _collect_state(self) -> None:
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.entity_states[self._entity_id] = None
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -957,6 +962,12 @@ class TemplateStateBase(State):
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
                 render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item == "state":
+                    render_info.entity_states.setdefault(
+                        self._entity_id, self._state.state
+                    )
+                else:
+                    render_info.entity_states[self._entity_id] = None
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -975,8 +986,11 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
-        return self._state.state
+        state = self._state.state
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.entity_states.setdefault(self._entity_id, state)
+        return state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
@@ -1092,6 +1106,7 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
         entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect.entity_states[entity_id] = None
 
 
 def _state_generator(
@@ -1099,19 +1114,23 @@ def _state_generator(
 ) -> Generator[TemplateState, None, None]:
     """State generator for a domain or all states."""
     states = hass.states
-    # If domain is None, we want to iterate over all states, but making
-    # a copy of the dict is expensive. So we iterate over the protected
-    # _states dict instead. This is safe because we're not modifying it
-    # and everything is happening in the same thread (MainThread).
+    # We want to iterate over all states or the states of a domain, but
+    # making a copy of the dict is expensive. So we iterate over the
+    # protected _states dict or _domain_index dict instead. This is safe
+    # because we're not modifying it and everything is happening in the
+    # same thread (MainThread).
     #
     # We do not want to expose this method in the public API though to
     # ensure it does not get misused.
     #
+    # pylint: disable=protected-access
     container: Iterable[State]
     if domain is None:
-        container = states._states.values()  # pylint: disable=protected-access
+        container = states._states.values()
+    elif domain_index := states._domain_index.get(domain):
+        container = domain_index.values()
     else:
-        container = states.async_all(domain)
+        return
     for state in container:
         yield _template_state_no_collect(hass, state)
 
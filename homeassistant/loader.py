@@ -12,8 +12,11 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
+import stat
 import sys
+import threading
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -22,10 +25,12 @@ from awesomeversion import (
     AwesomeVersionException,
     AwesomeVersionStrategy,
 )
+import orjson
 import voluptuous as vol
 
 from . import generated
-from .core import HomeAssistant, callback
+from .const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP, __version__
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -33,6 +38,7 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
+from .util.file import WriteError, write_utf8_file
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 # Typing imports that create a circular dependency
@@ -48,6 +54,10 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "manifest_cache"
+
+MANIFEST_CACHE_PATH = os.path.join(".storage", "core.manifest_cache")
+MANIFEST_CACHE_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -173,6 +183,139 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
 
 
+class ManifestCache:
+    """Cache of the parsed manifests which is persisted between starts.
+
+    The manifest of an integration is only taken from the cache if the
+    modification time and size of its manifest.json did not change, so
+    only new or changed manifests are read and parsed on startup. The
+    manifests which no longer exist are dropped from the cache when it
+    is saved.
+
+    This class is thread-safe since the manifests are read in the
+    executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the manifest cache."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._manifests: dict[str, tuple[int, int, Manifest]] | None = None
+        self._used: set[str] = set()
+        self._dirty = False
+
+    def _load(self) -> dict[str, tuple[int, int, Manifest]]:
+        """Load the cached manifests from disk."""
+        try:
+            data = json_loads(pathlib.Path(self.path).read_bytes())
+        except (OSError, *JSON_DECODE_EXCEPTIONS):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_CACHE_VERSION
+            or data.get("ha_version") != __version__
+        ):
+            return {}
+        manifests = cast(dict[str, list[Any]], data.get("manifests"))
+        try:
+            return {
+                manifest_path: (mtime_ns, size, manifest)
+                for manifest_path, (mtime_ns, size, manifest) in manifests.items()
+            }
+        except (AttributeError, TypeError, ValueError):
+            return {}
+
+    def read_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest of manifest_path, read it if it is not cached.
+
+        Returns None if manifest_path is not a file.
+        """
+        try:
+            stat_result = manifest_path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        key = str(manifest_path)
+        with self._lock:
+            if self._manifests is None:
+                self._manifests = self._load()
+            self._used.add(key)
+            if (cached := self._manifests.get(key)) is not None and cached[:2] == (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+            ):
+                # Integration adds keys to the manifest
+                return cast(Manifest, dict(cached[2]))
+
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        with self._lock:
+            assert self._manifests is not None
+            self._manifests[key] = (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                cast(Manifest, dict(manifest)),
+            )
+            self._dirty = True
+        return manifest
+
+    def save(self) -> None:
+        """Save the manifests if the cache changed."""
+        with self._lock:
+            if self._manifests is None:
+                return
+            # The manifests not read since the start are kept as long as
+            # they exist, the integration may still be loaded later on
+            for key in self._manifests.keys() - self._used:
+                if not os.path.isfile(key):
+                    del self._manifests[key]
+                    self._dirty = True
+            if not self._dirty:
+                return
+            data = {
+                "version": MANIFEST_CACHE_VERSION,
+                "ha_version": __version__,
+                "manifests": dict(self._manifests),
+            }
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, orjson.dumps(data).decode())
+        except (OSError, WriteError) as err:
+            _LOGGER.warning("Error saving the manifest cache: %s", err)
+
+
+@callback
+def async_setup_manifest_cache(hass: HomeAssistant) -> None:
+    """Cache the manifests read on startup for the next start.
+
+    The cache is saved once Home Assistant has started, and again when
+    it stops to include the manifests read after the start.
+    """
+    cache = hass.data[DATA_MANIFEST_CACHE] = ManifestCache(
+        hass.config.path(MANIFEST_CACHE_PATH)
+    )
+
+    async def _async_save_manifest_cache(_: Event) -> None:
+        await hass.async_add_executor_job(cache.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_manifest_cache)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_manifest_cache)
+
+
+def _read_manifest(hass: HomeAssistant, manifest_path: pathlib.Path) -> Manifest | None:
+    """Read a manifest, from the manifest cache if it is set up.
+
+    Returns None if manifest_path is not a file.
+    """
+    cache: ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+    if cache is not None:
+        return cache.read_manifest(manifest_path)
+    if not manifest_path.is_file():
+        return None
+    return cast(Manifest, json_loads(manifest_path.read_text()))
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -559,16 +702,15 @@ class Integration:
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                manifest = _read_manifest(hass, manifest_path)
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
+            if manifest is None:
+                continue
 
             integration = cls(
                 hass,
@@ -8,6 +8,8 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import os
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -227,6 +229,205 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_set_with_tracked_entities(hass):
+    """Write 100k states with 10k entities each tracked by their own listener."""
+    count = 0
+    entity_id = "sensor.benchmark"
+    states_to_write = 10**5
+    tracked_entities = 10**4
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(tracked_entities):
+        async_track_state_change_event(hass, f"{entity_id}{idx}", listener)
+
+    start = timer()
+
+    for idx in range(states_to_write):
+        hass.states.async_set(f"{entity_id}{idx % tracked_entities}", str(idx))
+
+    await hass.async_block_till_done()
+
+    assert count == states_to_write
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscription_matching(hass):
+    """Match 50k topics against 2k MQTT wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import (
+        Subscription,
+        WildcardSubscriptions,
+        _matcher_for_topic,
+    )
+
+    subscriptions = WildcardSubscriptions()
+    for idx in range(2000):
+        topic_filter = (
+            f"zigbee2mqtt/device_{idx}/#"
+            if idx % 2
+            else f"homeassistant/+/node_{idx}/+/config"
+        )
+        subscriptions.add(
+            Subscription(topic_filter, _matcher_for_topic(topic_filter), None)
+        )
+    topics = [
+        f"zigbee2mqtt/device_{idx % 4000}/state"
+        if idx % 2
+        else f"homeassistant/sensor/node_{idx % 4000}/temperature/config"
+        for idx in range(50000)
+    ]
+
+    start = timer()
+
+    matches = sum(len(subscriptions.matches(topic)) for topic in topics)
+
+    assert matches == 26000
+
+    return timer() - start
+
+
+@benchmark
+async def validate_access_tokens(hass):
+    """Validate 100k access tokens of 500 refresh tokens."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import auth
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth import auth_store
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
+
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    store = auth_store.AuthStore(hass)
+    # Do not write the users and tokens of the benchmark to disk
+    store._store = Store(  # pylint: disable=protected-access
+        hass, auth_store.STORAGE_VERSION, auth_store.STORAGE_KEY, read_only=True
+    )
+    manager = auth.AuthManager(hass, store, {}, {})
+    user = await manager.async_create_system_user("Benchmark")
+    access_tokens = [
+        manager.async_create_access_token(
+            await manager.async_create_refresh_token(user)
+        )
+        for _ in range(500)
+    ]
+    size = len(access_tokens)
+
+    start = timer()
+
+    for idx in range(10**5):
+        assert await manager.async_validate_access_token(access_tokens[idx % size])
+
+    return timer() - start
+
+
+def _write_recorder_states(bulk_insert: bool) -> float:
+    """Write 100k states of 100 entities to SQLite, 1000 states per commit."""
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.table_managers import states
+
+    states_to_write = 10**5
+    states_per_commit = 1000
+    entities = 100
+    states_manager = states.StatesManager()
+
+    with TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}")
+        Base.metadata.create_all(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+                for idx in range(entities)
+            ]
+            state_attributes = StateAttributes(
+                shared_attrs='{"unit_of_measurement":"W"}', hash=1
+            )
+            session.add_all([*states_meta, state_attributes])
+            session.commit()
+            events = [
+                core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": f"sensor.benchmark_{idx % entities}",
+                        "new_state": core.State(
+                            f"sensor.benchmark_{idx % entities}", str(idx)
+                        ),
+                    },
+                )
+                for idx in range(states_to_write)
+            ]
+
+            start = timer()
+
+            for idx, event in enumerate(events):
+                entity_id = event.data["entity_id"]
+                dbstate = States.from_event(event)
+                # Link the old states the same way the recorder does
+                if old_state := states_manager.pop_pending(entity_id):
+                    dbstate.old_state = old_state
+                elif old_state_id := states_manager.pop_committed(entity_id):
+                    dbstate.old_state_id = old_state_id
+                states_manager.add_pending(entity_id, dbstate)
+                dbstate.entity_id = None
+                dbstate.metadata_id = states_meta[idx % entities].metadata_id
+                dbstate.attributes_id = state_attributes.attributes_id
+                if bulk_insert:
+                    states_manager.add_pending_insert(dbstate)
+                else:
+                    session.add(dbstate)
+                if (idx + 1) % states_per_commit == 0:
+                    if bulk_insert:
+                        session.flush()
+                        states_manager.insert_pending(session)
+                    session.commit()
+                    states_manager.post_commit_pending()
+
+            runtime = timer() - start
+        engine.dispose()
+
+    print(f"{states_to_write / runtime:.0f} states/second")
+    return runtime
+
+
+@benchmark
+async def recorder_write_states_bulk_insert(hass):
+    """Write 100k states with the multi-row inserts of the recorder."""
+    return _write_recorder_states(True)
+
+
+@benchmark
+async def recorder_write_states_orm(hass):
+    """Write 100k states with the ORM unit of work of the recorder."""
+    return _write_recorder_states(False)
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -258,3 +258,33 @@ async def test_loading_race_condition(hass: HomeAssistant) -> None:
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_lookups(hass: HomeAssistant) -> None:
+    """Test looking up refresh tokens after they are created and removed."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user(name="Paulus")
+    refresh_token = await store.async_create_refresh_token(user, "client-id")
+    other_refresh_token = await store.async_create_refresh_token(user, "client-id")
+
+    assert await store.async_get_refresh_token(refresh_token.id) is refresh_token
+    assert (
+        await store.async_get_refresh_token_by_token(refresh_token.token)
+        is refresh_token
+    )
+    assert await store.async_get_refresh_token_by_token("invalid-token") is None
+
+    await store.async_remove_refresh_token(refresh_token)
+    assert refresh_token.id not in user.refresh_tokens
+    assert await store.async_get_refresh_token(refresh_token.id) is None
+    assert await store.async_get_refresh_token_by_token(refresh_token.token) is None
+    assert (
+        await store.async_get_refresh_token(other_refresh_token.id)
+        is other_refresh_token
+    )
+
+    await store.async_remove_user(user)
+    assert await store.async_get_refresh_token(other_refresh_token.id) is None
+    assert (
+        await store.async_get_refresh_token_by_token(other_refresh_token.token) is None
+    )
@@ -14,6 +14,7 @@ from homeassistant.auth import (
     InvalidAuthError,
     auth_store,
     const as auth_const,
+    jwt_wrapper,
     models as auth_models,
 )
 from homeassistant.auth.const import GROUP_ID_ADMIN, MFA_SESSION_EXPIRATION
@@ -572,6 +573,36 @@ async def test_remove_refresh_token(mock_hass) -> None:
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_token_cache(mock_hass) -> None:
+    """Test verified access tokens are cached until they are revoked."""
+    now = dt_util.utcnow()
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=jwt_wrapper.verify_and_decode,
+    ) as verify_mock:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert verify_mock.call_count == 1
+
+        with freeze_time(now + auth_const.VERIFIED_ACCESS_TOKEN_CACHE_TTL * 2):
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+        assert verify_mock.call_count == 2
+
+        user.is_active = False
+        assert await manager.async_validate_access_token(access_token) is None
+        user.is_active = True
+
+        await manager.async_remove_refresh_token(refresh_token)
+        assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_register_revoke_token_callback(mock_hass) -> None:
     """Test that a registered revoke token callback is called."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -446,6 +446,45 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+async def test_fetch_period_api_with_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the fetch period view for history downsampled to max_points."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    for state in ("0", "5", "1", "9", "unavailable", "3", "inf", "2", "8", "4"):
+        hass.states.async_set("sensor.power", state)
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}?filter_entity_id=sensor.power&minimal_response&max_points=6"
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    # Changes to and from values that are not finite numbers are always kept
+    assert [state["state"] for state in response_json[0]] == [
+        "0",
+        "1",
+        "9",
+        "unavailable",
+        "3",
+        "inf",
+        "2",
+        "8",
+        "4",
+    ]
+
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}?filter_entity_id=sensor.power&max_points=1"
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}?filter_entity_id=sensor.power&max_points=many"
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_fetch_period_api_with_no_timestamp(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -401,6 +401,179 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sending the history of each entity separately."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "no_attributes": True,
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    event = response["event"]
+    assert event["partial"] is True
+    assert event["start_time"] == now.timestamp()
+    assert list(event["states"]) == ["sensor.one"]
+    assert [state["s"] for state in event["states"]["sensor.one"]] == ["on", "off"]
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    event = response["event"]
+    assert "partial" not in event
+    assert list(event["states"]) == ["sensor.two"]
+    assert [state["s"] for state in event["states"]["sensor.two"]] == ["off"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"]["states"] == {}
+
+    # The subscription is removed after the last chunk
+    await client.send_json({"id": 3, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+    with patch.object(
+        websocket_api,
+        "_ws_get_significant_states_chunk",
+        side_effect=ValueError("boom"),
+    ):
+        await client.send_json(
+            {
+                "id": 4,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 4
+        response = await client.receive_json()
+        assert not response["success"]
+        assert response["id"] == 4
+
+    # The subscription is removed when sending the history fails
+    await client.send_json({"id": 5, "type": "unsubscribe_events", "subscription": 4})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsampled to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("0", "5", "1", "9", "unavailable", "3", "7", "2", "8", "4"):
+        hass.states.async_set("sensor.test", state)
+    for state in ("0", "5", "1", "9", "2", "3", "7", "6", "8", "4"):
+        hass.states.async_set("sensor.numeric", state)
+    for _ in range(5):
+        hass.states.async_set("binary_sensor.door", "on")
+        hass.states.async_set("binary_sensor.door", "off")
+    hass.states.async_set("sensor.other", "1")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": [
+                "sensor.test",
+                "sensor.numeric",
+                "binary_sensor.door",
+                "sensor.other",
+            ],
+            "max_points": 6,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    # The changes to and from unavailable are kept on top of max_points
+    assert [state["s"] for state in result["sensor.test"]] == [
+        "0",
+        "1",
+        "9",
+        "unavailable",
+        "3",
+        "2",
+        "8",
+        "4",
+    ]
+    assert len(result["sensor.numeric"]) <= 6
+    assert [state["s"] for state in result["sensor.numeric"]] == [
+        "0",
+        "1",
+        "9",
+        "3",
+        "8",
+        "4",
+    ]
+    # Entities without numeric states are not downsampled
+    assert [state["s"] for state in result["binary_sensor.door"]] == [
+        "on",
+        "off",
+    ] * 5
+    assert [state["s"] for state in result["sensor.other"]] == ["1"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -12,6 +12,7 @@ from homeassistant.components import image
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from .conftest import (
     MockImageEntity,
@@ -22,7 +23,12 @@ from .conftest import (
     MockURLImageEntity,
 )
 
-from tests.common import MockModule, mock_integration, mock_platform
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    mock_integration,
+    mock_platform,
+)
 from tests.typing import ClientSessionGenerator
 
 
@@ -58,6 +64,22 @@ async def test_config_entry(
     }
 
 
+async def test_update_tokens(hass: HomeAssistant, mock_image_platform: None) -> None:
+    """Test the access tokens are rotated periodically."""
+    state = hass.states.get("image.test")
+    access_token = state.attributes["access_token"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + image.TOKEN_CHANGE_INTERVAL)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("image.test")
+    new_access_token = state.attributes["access_token"]
+    assert new_access_token != access_token
+    assert state.attributes["entity_picture"] == (
+        f"/api/image_proxy/image.test?token={new_access_token}"
+    )
+
+
 @pytest.mark.freeze_time("2023-04-01 00:00:00+00:00")
 async def test_state_attr(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
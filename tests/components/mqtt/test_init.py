@@ -13,7 +13,12 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    WildcardSubscriptions,
+    _matcher_for_topic,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1971,6 +1976,74 @@ async def test_canceling_debouncer_throws(
         await hass.async_block_till_done()
 
 
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "test",
+        "test/topic",
+        "test/topic/sub",
+        "test/other/sub",
+        "other/topic",
+        "$SYS/broker/load",
+        "/leading",
+        "",
+    ],
+)
+def test_wildcard_subscriptions_match_paho_matcher(topic: str) -> None:
+    """Test the wildcard subscription trie matches like the paho matcher."""
+    topic_filters = [
+        "#",
+        "+",
+        "+/+",
+        "test/#",
+        "test/+",
+        "test/+/sub",
+        "+/topic/#",
+        "$SYS/#",
+        "$SYS/+/load",
+        "+/broker/load",
+        "/+",
+    ]
+    subscriptions = WildcardSubscriptions()
+    expected = []
+    for topic_filter in topic_filters:
+        subscription = Subscription(
+            topic_filter, _matcher_for_topic(topic_filter), MagicMock()
+        )
+        subscriptions.add(subscription)
+        if subscription.matcher(topic):
+            expected.append(subscription)
+
+    assert len(subscriptions) == len(topic_filters)
+    assert subscriptions.matches(topic) == expected
+
+
+def test_wildcard_subscriptions_add_remove() -> None:
+    """Test adding and removing subscriptions from the wildcard trie."""
+    subscriptions = WildcardSubscriptions()
+    first = Subscription("test/+/on", _matcher_for_topic("test/+/on"), MagicMock())
+    second = Subscription("test/+/on", _matcher_for_topic("test/+/on"), MagicMock())
+    subtree = Subscription("test/#", _matcher_for_topic("test/#"), MagicMock())
+    for subscription in (first, second, subtree):
+        subscriptions.add(subscription)
+
+    assert list(subscriptions) == [first, second, subtree]
+    assert subscriptions.has_topic("test/+/on")
+    assert not subscriptions.has_topic("test/+")
+    assert subscriptions.matches("test/bier/on") == [first, second, subtree]
+
+    subscriptions.remove(first)
+    assert subscriptions.matches("test/bier/on") == [second, subtree]
+    subscriptions.remove(second)
+    assert not subscriptions.has_topic("test/+/on")
+    assert subscriptions.matches("test/bier/on") == [subtree]
+    with pytest.raises(KeyError):
+        subscriptions.remove(second)
+    subscriptions.remove(subtree)
+    assert not subscriptions
+    assert subscriptions.matches("test/bier/on") == []
+
+
 async def test_initial_setup_logs_error(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -0,0 +1,143 @@
+"""The tests for the recorder state attributes manager."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from lru import LRU  # pylint: disable=no-name-in-module
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    WARM_UP_WINDOW,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_load_recently_used(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test loading the attributes used by recently recorded states."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    manager = instance.state_attributes_manager
+    now = dt_util.utcnow()
+
+    freezer.move_to(now - timedelta(seconds=WARM_UP_WINDOW + 60))
+    hass.states.async_set("sensor.old", "1", {"unit": "old"})
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(now)
+    hass.states.async_set("sensor.new", "1", {"unit": "new"})
+    await async_wait_recording_done(hass)
+
+    old_attrs = '{"unit":"old"}'
+    new_attrs = '{"unit":"new"}'
+    new_attributes_id = manager.get_from_cache(new_attrs)
+    assert new_attributes_id is not None
+    assert manager.get_from_cache(old_attrs) is not None
+
+    def _reset_and_load_recently_used() -> None:
+        manager.reset()
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            manager.load_recently_used(session)
+
+    await instance.async_add_executor_job(_reset_and_load_recently_used)
+
+    hits = manager.cache_hits
+    assert manager.get_from_cache(new_attrs) == new_attributes_id
+    assert manager.get_from_cache(old_attrs) is None
+    assert manager.cache_hits == hits + 1
+
+    misses = manager.cache_misses
+    hass.states.async_set("sensor.old", "2", {"unit": "old"})
+    await async_wait_recording_done(hass)
+    assert manager.cache_misses == misses + 1
+    assert manager.get_from_cache(old_attrs) is not None
+
+
+async def test_load_recently_used_most_recent_first(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the most recently used attributes are loaded when they do not all fit."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    manager = instance.state_attributes_manager
+    now = dt_util.utcnow()
+
+    for minutes, unit in ((3, "a"), (2, "b"), (1, "c"), (0, "a")):
+        freezer.move_to(now - timedelta(minutes=minutes))
+        hass.states.async_set("sensor.test", str(minutes), {"unit": unit})
+        await async_wait_recording_done(hass)
+
+    def _reset_and_load_recently_used() -> None:
+        manager.reset()
+        manager._id_map = LRU(2)
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            manager.load_recently_used(session)
+
+    await instance.async_add_executor_job(_reset_and_load_recently_used)
+
+    # The keys are ordered from the most to the least recently used
+    assert manager._id_map.keys() == ['{"unit":"a"}', '{"unit":"c"}']
+
+
+async def test_load_recently_used_empty_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test loading recently used attributes without any recorded states."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    manager = instance.state_attributes_manager
+
+    def _load_recently_used() -> None:
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            manager.load_recently_used(session)
+
+    await instance.async_add_executor_job(_load_recently_used)
+    assert manager.get_from_cache("{}") is None
+
+
+async def test_cache_hit_rate(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the hits and misses of the cache are counted."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    manager = instance.state_attributes_manager
+    hass.states.async_set("sensor.test", "1", {"unit": "test"})
+    await async_wait_recording_done(hass)
+
+    hits = manager.cache_hits
+    misses = manager.cache_misses
+
+    def _get_many() -> dict[str, int | None]:
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            return manager.get_many(
+                (('{"unit":"test"}', 1), ('{"unit":"missing"}', 2)), session
+            )
+
+    results = await instance.async_add_executor_job(_get_many)
+    assert results['{"unit":"test"}'] is not None
+    assert results['{"unit":"missing"}'] is None
+    assert manager.cache_hits == hits + 1
+    assert manager.cache_misses == misses + 1
+
+    manager.cache_hits = 3
+    manager.cache_misses = 1
+    assert manager.cache_hit_rate == 0.75
+    manager.cache_hits = manager.cache_misses = 0
+    assert manager.cache_hit_rate is None
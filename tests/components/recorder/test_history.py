@@ -298,6 +298,13 @@ def test_state_changes_during_period_descending(
         states, list(reversed(list(hist[entity_id])))
     )
 
+    hist = history.state_changes_during_period(
+        hass, start, end, entity_id, no_attributes=False, descending=True, limit=2
+    )
+    assert_multiple_states_equal_without_context(
+        states[-2:], list(reversed(list(hist[entity_id])))
+    )
+
     start_time = point2 + timedelta(microseconds=10)
     hist = history.state_changes_during_period(
         hass,
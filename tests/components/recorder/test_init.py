@@ -379,11 +379,11 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance.states_manager._pending_inserts or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -1391,6 +1391,56 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+def test_saving_sets_old_state_in_same_commit(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test saving sets old state when the old state is in the same commit."""
+    hass = hass_recorder({"commit_interval": 30})
+    assert get_instance(hass).bulk_insert_states is True
+
+    hass.states.set("test.one", "s1", {"attr": 1})
+    hass.states.set("test.two", "s2", {"attr": 1})
+    hass.states.set("test.one", "s3", {"attr": 2})
+    hass.states.set("test.one", "s4", {"attr": 1})
+    wait_recording_done(hass)
+    # Commit anything recorded after the states as well so the recorder
+    # does not hold on to the in-memory database connection
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s4"].entity_id == "test.one"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s2"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s4"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id != states_by_state["s3"].attributes_id
+        )
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
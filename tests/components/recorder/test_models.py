@@ -18,12 +18,14 @@ from homeassistant.components.recorder.models import (
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
+    row_to_compressed_state,
     ulid_to_bytes_or_none,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import dt as dt_util
 
 
@@ -288,6 +290,33 @@ async def test_lazy_state_can_decode_attributes(
     }
 
 
+async def test_row_to_compressed_state_shares_attributes(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test compressed states embed the attributes from the row as json."""
+    attr_cache = {}
+    rows = [
+        PropertyMock(attributes='{"shared":true}', last_changed_ts=None),
+        PropertyMock(attributes='{"shared":true}', last_changed_ts=None),
+        PropertyMock(attributes="{}", last_changed_ts=None),
+        PropertyMock(attributes="{INVALID_JSON}", last_changed_ts=None),
+    ]
+    compressed_states = [
+        row_to_compressed_state(row, attr_cache, None, "sensor.valid", "on", 1, False)
+        for row in rows
+    ]
+    assert (
+        compressed_states[0]["a"] is compressed_states[1]["a"]
+    ), "attributes should be deduplicated"
+    assert json_dumps(compressed_states) == (
+        '[{"s":"on","a":{"shared":true},"lu":1},'
+        '{"s":"on","a":{"shared":true},"lu":1},'
+        '{"s":"on","a":{},"lu":1},'
+        '{"s":"on","a":{},"lu":1}]'
+    )
+    assert "Error converting row to state attributes" in caplog.text
+
+
 async def test_lazy_state_handles_different_last_updated_and_last_changed(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
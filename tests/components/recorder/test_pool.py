@@ -6,7 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from homeassistant.components.recorder.const import DB_WORKER_PREFIX
-from homeassistant.components.recorder.pool import RecorderPool
+from homeassistant.components.recorder.pool import RecorderPool, get_pool_size
 
 
 async def test_recorder_pool_called_from_event_loop() -> None:
@@ -64,3 +64,12 @@ def test_recorder_pool(caplog: pytest.LogCaptureFixture) -> None:
     new_thread.join()
     assert "accesses the database without the database executor" not in caplog.text
     assert connections[6] != connections[7]
+
+
+@pytest.mark.parametrize(
+    ("cpu_count", "pool_size"),
+    [(None, 5), (1, 5), (4, 5), (6, 7), (10, 11), (64, 11)],
+)
+def test_get_pool_size(cpu_count: int | None, pool_size: int) -> None:
+    """Test the pool is sized to the number of CPUs within the bounds."""
+    assert get_pool_size(cpu_count) == pool_size
@@ -10,7 +10,6 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import purge, queries
 from homeassistant.components.recorder.const import (
     SQLITE_MAX_BIND_VARS,
     SupportedDialect,
@@ -159,6 +158,89 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge stops after the batch exceeding the time budget and resumes."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False, time_budget=0)
+        assert not finished
+        assert states.count() == 2
+        progress = instance.purge_progress
+        assert progress is not None
+        assert progress.purge_before == purge_before
+        assert progress.rows == 4
+        assert progress.oldest_ts is not None
+        assert progress.oldest_ts > progress.first_oldest_ts
+
+        finished = purge_old_data(instance, purge_before, repack=False, time_budget=0)
+        assert finished
+        assert states.count() == 2
+        assert instance.purge_progress is None
+
+
+async def test_purge_old_events_after_states_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test events are left to the next purge once the states used the time budget."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False, time_budget=0)
+        assert not finished
+        assert session.query(States).count() == 2
+        assert events.count() == 6
+
+        finished = purge_old_data(instance, purge_before, repack=False, time_budget=0)
+        assert not finished
+        assert events.count() == 2
+
+        finished = purge_old_data(instance, purge_before, repack=False, time_budget=0)
+        assert finished
+        assert instance.purge_progress is None
+
+
+async def test_purge_progress_reset_on_error(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the purge progress is reset when the purge fails."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    finished = purge_old_data(instance, purge_before, repack=False, time_budget=0)
+    assert not finished
+    assert instance.purge_progress is not None
+
+    with patch(
+        "homeassistant.components.recorder.purge._purge_states_and_attributes_ids",
+        side_effect=OperationalError("statement", {}, Exception()),
+    ):
+        finished = purge_old_data(instance, purge_before, repack=False)
+    assert finished
+    assert instance.purge_progress is None
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -1605,11 +1687,9 @@ async def test_purge_many_old_events(
 ) -> None:
     """Test deleting old events."""
     old_events_count = 5
-    with patch.object(queries, "SQLITE_MAX_BIND_VARS", old_events_count), patch.object(
-        purge, "SQLITE_MAX_BIND_VARS", old_events_count
-    ):
-        instance = await async_setup_recorder_instance(hass)
-
+    instance = await async_setup_recorder_instance(hass)
+    assert instance.database_engine is not None
+    with patch.object(instance.database_engine, "max_bind_vars", old_events_count):
         await _add_test_events(hass, old_events_count)
 
         with session_scope(hass=hass) as session:
@@ -1,6 +1,6 @@
 """The tests for sensor recorder platform."""
 from collections.abc import Callable
-from datetime import timedelta
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
@@ -322,6 +322,252 @@ def test_compile_periodic_statistics_exception(
     }
 
 
+def test_compile_hourly_statistics_from_short_term_manager(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test hourly statistics are summarized from memory when possible."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+
+    def sensor_stats(entity_id, start, idx):
+        """Generate fake statistics."""
+        return {
+            "meta": {
+                "has_mean": True,
+                "has_sum": True,
+                "name": None,
+                "statistic_id": entity_id,
+                "unit_of_measurement": "dogs",
+            },
+            "stat": {
+                "start": start,
+                "mean": idx * 1.5,
+                "min": idx - 2.0,
+                "max": idx * 2.0,
+                "last_reset": zero,
+                "state": float(idx),
+                "sum": idx * 10.0,
+            },
+        }
+
+    def get_fake_stats(_hass, start, _end):
+        idx = int((start - zero).total_seconds() // 300)
+        return statistics.PlatformCompiledStatistics(
+            [
+                sensor_stats("sensor.test1", start, idx),
+                sensor_stats("sensor.test2", start, idx + 1),
+            ],
+            get_metadata(_hass, statistic_ids={"sensor.test1", "sensor.test2"}),
+        )
+
+    def expected_hour(hour, offset):
+        idxs = [hour * 12 + idx + offset for idx in range(12)]
+        return {
+            "start": (zero + timedelta(hours=hour)).timestamp(),
+            "end": (zero + timedelta(hours=hour + 1)).timestamp(),
+            "mean": pytest.approx(sum(idxs) * 1.5 / 12),
+            "min": pytest.approx(idxs[0] - 2.0),
+            "max": pytest.approx(idxs[-1] * 2.0),
+            "last_reset": zero.timestamp(),
+            "state": pytest.approx(float(idxs[-1])),
+            "sum": pytest.approx(idxs[-1] * 10.0),
+        }
+
+    with patch(
+        "homeassistant.components.sensor.recorder.compile_statistics",
+        side_effect=get_fake_stats,
+    ), patch(
+        "homeassistant.components.recorder.statistics._compile_hourly_statistics_summary",
+        wraps=statistics._compile_hourly_statistics_summary,
+    ) as compile_summary_mock:
+        # The first hour is compiled from memory
+        for idx in range(12):
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=5 * idx))
+        wait_recording_done(hass)
+        assert compile_summary_mock.call_count == 0
+
+        # The second hour falls back to the database after the short term
+        # statistics have been changed
+        for idx in range(12, 18):
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=5 * idx))
+        wait_recording_done(hass)
+        recorder.get_instance(hass).statistics_short_term_manager.reset()
+        for idx in range(18, 24):
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=5 * idx))
+        wait_recording_done(hass)
+        assert compile_summary_mock.call_count == 1
+
+    stats = statistics_during_period(hass, zero, period="hour")
+    assert stats == {
+        "sensor.test1": [expected_hour(0, 0), expected_hour(1, 0)],
+        "sensor.test2": [expected_hour(0, 1), expected_hour(1, 1)],
+    }
+
+
+def test_reduced_statistics_cache(hass_recorder: Callable[..., HomeAssistant]) -> None:
+    """Test statistics reduced per day are cached until they are changed."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    statistics_reduced_manager = instance.statistics_reduced_manager
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 23:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    previous_hour = dt_util.utcnow().replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(hours=1)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        (
+            {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+            {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+            {"start": previous_hour, "last_reset": None, "state": 2, "sum": 4},
+        ),
+    )
+    wait_recording_done(hass)
+
+    def _daily_sums(end_time=None):
+        stats = statistics_during_period(
+            hass,
+            period1,
+            end_time,
+            statistic_ids={"test:total_energy_import"},
+            period="day",
+        )
+        return [row["sum"] for row in stats["test:total_energy_import"]]
+
+    assert _daily_sums() == [3, 4]
+
+    with patch(
+        "homeassistant.components.recorder.statistics._reduce_statistics_per_day",
+        wraps=statistics._reduce_statistics_per_day,
+    ) as reduce_mock:
+        # Only the day of the previous hour is reduced again
+        stats = statistics_during_period(
+            hass,
+            period1,
+            statistic_ids={"test:total_energy_import"},
+            period="day",
+        )
+        assert reduce_mock.call_count == 1
+        assert reduce_mock.call_args[0][0] == {
+            "test:total_energy_import": [
+                {
+                    "start": previous_hour.timestamp(),
+                    "end": previous_hour.timestamp() + 3600,
+                    "last_reset": None,
+                    "state": 2,
+                    "sum": 4,
+                }
+            ]
+        }
+        # Changing the returned rows does not change the cached rows
+        stats["test:total_energy_import"][0]["sum"] = 100
+        assert _daily_sums() == [3, 4]
+        assert reduce_mock.call_count == 2
+
+        # Days which are cached are not reduced again
+        assert _daily_sums(period2) == [3]
+        assert reduce_mock.call_count == 2
+
+        # Only the statistics that may include the changed hours are invalidated
+        statistics_reduced_manager.invalidate(previous_hour)
+        assert _daily_sums(period2) == [3]
+        assert reduce_mock.call_count == 2
+        statistics_reduced_manager.invalidate(period2)
+        assert _daily_sums(period2) == [3]
+        assert reduce_mock.call_count == 3
+
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        ({"start": period3, "last_reset": None, "state": 2, "sum": 5},),
+    )
+    wait_recording_done(hass)
+    assert _daily_sums() == [3, 5, 4]
+
+
+def test_reduced_statistics_cache_time_zone(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test statistics reduced per day are not reused after the time zone changed."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    hass.config.set_time_zone("Europe/Amsterdam")
+
+    period1 = datetime(2022, 10, 3, 0, tzinfo=dt_util.UTC)
+    period2 = datetime(2022, 10, 3, 23, tzinfo=dt_util.UTC)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        (
+            {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+            {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+        ),
+    )
+    wait_recording_done(hass)
+
+    def _daily_sums():
+        stats = statistics_during_period(
+            hass,
+            period1,
+            statistic_ids={"test:total_energy_import"},
+            period="day",
+        )
+        return [
+            (dt_util.utc_from_timestamp(row["start"]), row["sum"])
+            for row in stats["test:total_energy_import"]
+        ]
+
+    # The hours are in different days in UTC+2
+    assert _daily_sums() == [
+        (datetime(2022, 10, 2, 22, tzinfo=dt_util.UTC), 2),
+        (datetime(2022, 10, 3, 22, tzinfo=dt_util.UTC), 3),
+    ]
+
+    hass.config.set_time_zone("UTC")
+    assert _daily_sums() == [(period1, 3)]
+
+
+def test_reduced_statistics_manager_time_zone(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test the cached reduced statistics are dropped when the time zone changes."""
+    hass = hass_recorder()
+    statistics_reduced_manager = recorder.get_instance(hass).statistics_reduced_manager
+    generation = statistics_reduced_manager.generation
+    statistics_reduced_manager.set("key", 0, 3600, {}, generation)
+    assert statistics_reduced_manager.get("key", 0, None) == (3600, {})
+
+    hass.config.set_time_zone("Europe/Amsterdam")
+    assert statistics_reduced_manager.get("key", 0, None) is None
+    assert statistics_reduced_manager.generation != generation
+    # Results computed before the time zone changed are not cached
+    statistics_reduced_manager.set("key", 0, 3600, {}, generation)
+    assert statistics_reduced_manager.get("key", 0, None) is None
+
+
 def test_rename_entity(hass_recorder: Callable[..., HomeAssistant]) -> None:
     """Test statistics is migrated when entity_id is changed."""
     hass = hass_recorder()
@@ -1,12 +1,16 @@
 """Test recorder system health."""
+from datetime import datetime
+import time
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 
 from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.purge import PurgeProgress
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -35,6 +39,49 @@ async def test_recorder_system_health(
     }
 
 
+async def test_recorder_system_health_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health while a purge is running."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    purge_before = datetime(2023, 1, 1, 1, 40, tzinfo=dt_util.UTC)
+    instance.purge_progress = PurgeProgress(
+        purge_before,
+        purge_before.timestamp() - 100,
+        oldest_ts=purge_before.timestamp() - 50,
+        rows=1200,
+        start=time.monotonic() - 120,
+    )
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_progress"] == (
+        "1200 rows purged (10 rows/s), about 2 minutes remaining"
+    )
+
+    instance.purge_progress = None
+    info = await get_system_health_info(hass, "recorder")
+    assert "purge_progress" not in info
+
+
+async def test_recorder_system_health_state_attributes_cache_hit_rate(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health shows the hit rate of the attributes cache."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    manager = get_instance(hass).state_attributes_manager
+    manager.cache_hits = 0
+    manager.cache_misses = 0
+    info = await get_system_health_info(hass, "recorder")
+    assert "state_attributes_cache_hit_rate" not in info
+
+    manager.cache_hits = 95
+    manager.cache_misses = 5
+    info = await get_system_health_info(hass, "recorder")
+    assert info["state_attributes_cache_hit_rate"] == "95.0%"
+
+
 @pytest.mark.parametrize(
     "dialect_name", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -346,6 +346,59 @@ async def test_sampling_size_reduced(hass: HomeAssistant) -> None:
     assert state.attributes.get("buffer_usage_ratio") == round(5 / 5, 2)
 
 
+async def test_sampling_size_reduced_characteristics(hass: HomeAssistant) -> None:
+    """Test the characteristics stay correct while samples leave the buffer."""
+    characteristics: dict[str, Any] = {
+        "distance_absolute": lambda values: max(values) - min(values),
+        "median": statistics.median,
+        "percentile": lambda values: statistics.quantiles(
+            values, n=100, method="exclusive"
+        )[49],
+        "standard_deviation": statistics.stdev,
+        "sum_differences": lambda values: sum(
+            abs(j - i) for i, j in zip(values, values[1:])
+        ),
+        "value_min": min,
+        "variance": statistics.variance,
+    }
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": f"test_{characteristic}",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 4,
+                    "percentile": 50,
+                }
+                for characteristic in characteristics
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    values = VALUES_NUMERIC * 3
+    for count, value in enumerate(values, 1):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+        if count < 4:
+            continue
+
+        for characteristic, expected_fn in characteristics.items():
+            state = hass.states.get(f"sensor.test_{characteristic}")
+            assert state is not None
+            assert float(state.state) == round(
+                expected_fn(values[count - 4 : count]), 2
+            ), characteristic
+
+
 async def test_sampling_size_1(hass: HomeAssistant) -> None:
     """Test validity of stats requiring only one sample."""
     assert await async_setup_component(
@@ -1348,6 +1401,74 @@ async def test_initialize_from_database_with_maxage(
     ) + timedelta(hours=1)
 
 
+async def test_initialize_from_database_source_not_set_up(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the sensors are initialized from the database before their sources."""
+    # enable and pre-fill the recorder
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    for value in VALUES_NUMERIC:
+        for entity_id in ("sensor.test_monitored", "sensor.test_monitored_2"):
+            hass.states.async_set(
+                entity_id,
+                str(value),
+                {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+            )
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    # The sources are not set up yet, so the unit is taken from the database
+    hass.states.async_remove("sensor.test_monitored")
+    hass.states.async_remove("sensor.test_monitored_2")
+
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test_mean",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": "mean",
+                    "max_age": {"hours": 1},
+                },
+                {
+                    "platform": "statistics",
+                    "name": "test_mean_2",
+                    "entity_id": "sensor.test_monitored_2",
+                    "state_characteristic": "mean",
+                    "sampling_size": 5,
+                    "max_age": {"hours": 1},
+                },
+                {
+                    "platform": "statistics",
+                    "name": "test_count",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": "count",
+                    "sampling_size": 100,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_mean")
+    assert state is not None
+    assert state.state == str(round(sum(VALUES_NUMERIC) / len(VALUES_NUMERIC), 2))
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.CELSIUS
+    state = hass.states.get("sensor.test_mean_2")
+    assert state is not None
+    # The removal of the source is the newest of the 5 recorded states
+    assert state.state == str(round(sum(VALUES_NUMERIC[-4:]) / 4, 2))
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.CELSIUS
+    state = hass.states.get("sensor.test_count")
+    assert state is not None
+    assert state.state == str(len(VALUES_NUMERIC))
+
+
 async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Verify we can reload statistics sensors."""
 
@@ -431,6 +431,45 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_merge_queued_state_diffs(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state diffs of the same entity are merged while queued."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.permitted"]["s"] == "off"
+
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_MERGE_STATE_DIFFS",
+        0,
+    ):
+        hass.states.async_set("light.permitted", "on", {"color": "blue"})
+        hass.states.async_set(
+            "light.permitted", "on", {"color": "blue", "brightness": 100}
+        )
+        hass.states.async_set("light.permitted", "off", {"brightness": 100})
+        hass.states.async_set("light.other", "on")
+        await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    diff = msg["event"]["c"]["light.permitted"]
+    assert diff["-"] == {"a": ["color"]}
+    assert diff["+"]["a"] == {"brightness": 100}
+    assert "s" not in diff["+"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["a"]["light.other"]["s"] == "on"
+
+    hass.states.async_set("light.permitted", "on", {"brightness": 100})
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "on"
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -5,10 +5,12 @@ from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -82,6 +84,23 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_diff_message_add_reuses_state_json(
+    hass: HomeAssistant,
+) -> None:
+    """Test the state diff message for added states reuses the state json."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"color": "red"})
+    await hass.async_block_till_done()
+
+    event: Event = state_change_events[-1]
+    new_state: State = event.data["new_state"]
+    message = cached_state_diff_message(5, event)
+    assert json_loads(message) == json_loads(
+        message_to_json({"id": 5, "type": "event", "event": _state_diff_event(event)})
+    )
+    assert new_state.as_compressed_state_json() in message
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -19,6 +19,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.core import Context, HomeAssistant, HomeAssistantError
+from homeassistant.exceptions import NoEntitySpecifiedError
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
@@ -1505,3 +1506,44 @@ async def test_invalid_state(
     ent._attr_state = "x" * 255
     ent.async_write_ha_state()
     assert hass.states.get("test.test").state == "x" * 255
+
+
+async def test_async_write_ha_states(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test writing the state of multiple entities at once."""
+    context = Context()
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.hass = hass
+        ent.entity_id = f"test.test_{idx}"
+        ent._attr_state = str(idx)
+        entities.append(ent)
+    entities[2].async_set_context(context)
+
+    entity.async_write_ha_states(hass, entities)
+    state_0 = hass.states.get("test.test_0")
+    state_1 = hass.states.get("test.test_1")
+    state_2 = hass.states.get("test.test_2")
+    assert [state_0.state, state_1.state, state_2.state] == ["0", "1", "2"]
+    assert state_0.last_updated == state_1.last_updated
+    assert state_0.context == state_1.context
+    assert state_2.context == context
+
+    caplog.clear()
+    entities[0]._attr_state = "x" * 256
+    entities[1]._attr_state = "changed"
+    entity.async_write_ha_states(hass, entities[:2])
+    assert hass.states.get("test.test_0").state == STATE_UNKNOWN
+    assert hass.states.get("test.test_1").state == "changed"
+    assert (
+        "homeassistant.helpers.entity",
+        logging.ERROR,
+        f"Failed to set state, fall back to {STATE_UNKNOWN}",
+    ) in caplog.record_tuples
+
+    ent = entity.Entity()
+    ent.hass = hass
+    with pytest.raises(NoEntitySpecifiedError):
+        entity.async_write_ha_states(hass, [ent])
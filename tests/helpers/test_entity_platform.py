@@ -553,6 +553,33 @@ async def test_async_remove_with_platform(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the states of the entities of a platform at once."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({})
+    entity1 = MockEntity(name="test_1", state="on")
+    entity2 = MockEntity(name="test_2", state="on")
+    await component.async_add_entities([entity1, entity2])
+    platform = entity1.platform
+    assert platform is not None
+
+    entity1._values["state"] = "off"
+    entity2._values["state"] = "off"
+    platform.async_write_ha_states()
+    state1 = hass.states.get(entity1.entity_id)
+    state2 = hass.states.get(entity2.entity_id)
+    assert state1.state == "off"
+    assert state2.state == "off"
+    assert state1.last_updated == state2.last_updated
+    assert state1.context == state2.context
+
+    entity1._values["state"] = "on"
+    entity2._values["state"] = "on"
+    platform.async_write_ha_states([entity2])
+    assert hass.states.get(entity1.entity_id).state == "off"
+    assert hass.states.get(entity2.entity_id).state == "on"
+
+
 async def test_async_remove_with_platform_update_finishes(hass: HomeAssistant) -> None:
     """Remove an entity when an update finishes after its been removed."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -1475,6 +1475,49 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_device_and_area_index() -> None:
+    """Test the EntityRegistryItems device and area indexes."""
+    entities = er.EntityRegistryItems()
+    assert entities.get_entries_for_device_id("device1") == []
+    assert entities.get_entries_for_area_id("kitchen") == []
+
+    entry1 = er.RegistryEntry(
+        "test.entity1", "1234", "hue", device_id="device1", area_id="kitchen"
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        device_id="device1",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device1") == [entry1]
+    assert entities.get_entries_for_device_id(
+        "device1", include_disabled_entities=True
+    ) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+
+    moved_entry1 = attr.evolve(entry1, device_id="device2", area_id="living_room")
+    entities["test.entity1"] = moved_entry1
+
+    assert entities.get_entries_for_device_id(
+        "device1", include_disabled_entities=True
+    ) == [entry2]
+    assert entities.get_entries_for_device_id("device2") == [moved_entry1]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("living_room") == [moved_entry1]
+
+    del entities["test.entity1"]
+    entities.pop("test.entity2")
+
+    assert entities.get_entries_for_device_id("device1") == []
+    assert entities.get_entries_for_device_id("device2") == []
+    assert entities.get_entries_for_area_id("living_room") == []
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
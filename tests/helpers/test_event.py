@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
@@ -23,6 +23,7 @@ from homeassistant.helpers.event import (
     EventStateChangedData,
     TrackStates,
     TrackTemplate,
+    TrackTemplateRenderStats,
     TrackTemplateResult,
     async_call_later,
     async_track_device_registry_updated_event,
@@ -537,6 +538,35 @@ async def test_async_track_state_change_event_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_event_shares_bus_listener(
+    hass: HomeAssistant,
+) -> None:
+    """Test many async_track_state_change_event callers share one bus listener."""
+    calls: dict[str, int] = {}
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    @ha.callback
+    def _listener(event: EventType[EventStateChangedData]) -> None:
+        entity_id = event.data["entity_id"]
+        calls[entity_id] = calls.get(entity_id, 0) + 1
+
+    unsubs = [
+        async_track_state_change_event(hass, f"sensor.test_{idx}", _listener)
+        for idx in range(100)
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("sensor.test_5", "on")
+    hass.states.async_set("sensor.test_50", "on")
+    hass.states.async_set("sensor.untracked", "on")
+    await hass.async_block_till_done()
+    assert calls == {"sensor.test_5": 1, "sensor.test_50": 1}
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_async_track_state_added_domain(hass: HomeAssistant) -> None:
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -1048,6 +1078,91 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_skips_unobserved_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes the template did not read do not re-render it."""
+    runs = []
+
+    template = Template(
+        "{{ states('sensor.test') }} {{ states.sensor.other.attributes.unit }}",
+        hass,
+    )
+
+    @ha.callback
+    def run_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    hass.states.async_set("sensor.test", "1", {"unit": "W"})
+    hass.states.async_set("sensor.other", "1", {"unit": "W"})
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], run_callback
+    )
+    await hass.async_block_till_done()
+    assert runs == []
+
+    # Only the state of sensor.test was read
+    hass.states.async_set("sensor.test", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert info.render_stats[template] == TrackTemplateRenderStats(
+        skipped=1, rendered=0
+    )
+
+    # The attributes of sensor.other were read
+    hass.states.async_set("sensor.other", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert runs == ["1 kW"]
+    assert info.render_stats[template] == TrackTemplateRenderStats(
+        skipped=1, rendered=1
+    )
+
+    hass.states.async_set("sensor.test", "2", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert runs == ["1 kW", "2 kW"]
+
+    hass.states.async_remove("sensor.test")
+    await hass.async_block_till_done()
+    assert runs == ["1 kW", "2 kW", "unknown kW"]
+    assert info.render_stats[template] == TrackTemplateRenderStats(
+        skipped=1, rendered=3
+    )
+
+
+async def test_track_template_result_domain_does_not_skip(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes are not skipped when the entity is also tracked by domain."""
+    runs = []
+
+    template = Template(
+        "{{ states('sensor.test') }}"
+        " {{ states.sensor | map(attribute='attributes.unit') | join(',') }}",
+        hass,
+    )
+
+    @ha.callback
+    def run_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    hass.states.async_set("sensor.test", "1", {"unit": "W"})
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None, timedelta(seconds=0))], run_callback
+    )
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("sensor.test", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert runs == ["1 kW"]
+    assert info.render_stats[template].skipped == 0
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -262,7 +262,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
-async def test_dump_data(hass: HomeAssistant) -> None:
+async def test_dump_data(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
     """Test that we cache data."""
     states = [
         State("input_boolean.b0", "on"),
@@ -300,14 +300,8 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     for state in states:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
-        await data.async_dump_states()
-
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    await data.async_dump_states()
+    written_states = hass_storage[STORAGE_KEY]["data"]
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -331,14 +325,8 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     for state in states:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
-        await data.async_dump_states()
-
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    await data.async_dump_states()
+    written_states = hass_storage[STORAGE_KEY]["data"]
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
@@ -679,6 +679,42 @@ async def test_loading_corrupt_file_known_domain(
     await hass.async_stop(force=True)
 
 
+async def test_not_writing_unchanged_data(tmpdir: py.path.local) -> None:
+    """Test the file is not rewritten when the data is unchanged."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+
+    with patch(
+        "homeassistant.helpers.storage.write_utf8_file",
+        wraps=storage.write_utf8_file,
+    ) as write_mock:
+        await store.async_save({"hello": "world"})
+        assert write_mock.call_count == 1
+
+        await store.async_save({"hello": "world"})
+        assert write_mock.call_count == 1
+
+        await store.async_save({"hello": "earth"})
+        assert write_mock.call_count == 2
+
+        await hass.async_add_executor_job(os.unlink, store.path)
+        await store.async_save({"hello": "earth"})
+        assert write_mock.call_count == 3
+
+        await store.async_remove()
+        await store.async_save({"hello": "earth"})
+        assert write_mock.call_count == 4
+
+    assert await store.async_load() == {"hello": "earth"}
+
+    await hass.async_stop(force=True)
+
+
 async def test_os_error_is_fatal(tmpdir: py.path.local) -> None:
     """Test OSError during load is fatal."""
     loop = asyncio.get_running_loop()
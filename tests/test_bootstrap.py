@@ -1,8 +1,10 @@
 """Test the bootstrapping."""
 import asyncio
 from collections.abc import Generator, Iterable
+from datetime import timedelta
 import glob
 import os
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -35,6 +37,16 @@ def apply_mock_storage(hass_storage: dict[str, Any]) -> None:
     """Apply the storage mock."""
 
 
+@pytest.fixture(autouse=True)
+def mock_manifest_cache_path(tmp_path: Path) -> Generator[None, None, None]:
+    """Keep the manifest cache out of the test config dir."""
+    with patch(
+        "homeassistant.loader.MANIFEST_CACHE_PATH",
+        str(tmp_path / "core.manifest_cache"),
+    ):
+        yield
+
+
 @pytest.fixture(autouse=True)
 async def apply_stop_hass(stop_hass: None) -> None:
     """Make sure all hass are stopped."""
@@ -958,3 +970,42 @@ async def test_bootstrap_dependencies(
     assert (
         f"Dependency {integration} will wait for dependencies ['mqtt']" in caplog.text
     )
+
+
+async def test_setup_critical_path(hass: HomeAssistant) -> None:
+    """Test finding the chain of integrations which took longest to set up."""
+    integrations = {
+        domain: Integration(
+            hass,
+            f"homeassistant.components.{domain}",
+            None,
+            {
+                "domain": domain,
+                "name": domain,
+                "dependencies": dependencies,
+                "after_dependencies": after_dependencies,
+                "requirements": [],
+            },
+        )
+        for domain, dependencies, after_dependencies in (
+            ("http", [], []),
+            ("frontend", ["http"], []),
+            ("cloud", ["http"], []),
+            ("local", [], ["cloud", "missing"]),
+            ("fast", ["frontend"], []),
+        )
+    }
+    setup_time = {
+        "http": timedelta(seconds=1),
+        "frontend": timedelta(seconds=2),
+        "cloud": timedelta(seconds=3),
+        "local": timedelta(seconds=0.5),
+        "fast": timedelta(seconds=0.1),
+    }
+
+    assert bootstrap._get_setup_critical_path(setup_time, integrations) == [
+        "http",
+        "cloud",
+        "local",
+    ]
+    assert bootstrap._get_setup_critical_path({}, integrations) == []
@@ -1112,6 +1112,81 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.ceiling", "off")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 200}, False),
+            ("light.ceiling", "off", None, False),
+            ("switch.new", "on", None, False),
+            ("switch.new", "off", None, False),
+        ]
+    )
+    # All states are set before any event is dispatched
+    assert hass.states.get("light.bowl").attributes == {"brightness": 200}
+    assert hass.states.get("switch.new").state == "off"
+    assert hass.states.async_entity_ids("switch") == ["switch.new"]
+    await hass.async_block_till_done()
+
+    # Entries for the same entity are merged into a single state
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "switch.new",
+    ]
+    bowl_state = events[0].data["new_state"]
+    switch_state = events[1].data["new_state"]
+    assert events[0].data["old_state"].state == "on"
+    assert events[1].data["old_state"] is None
+    assert switch_state.state == "off"
+    assert switch_state is hass.states.get("switch.new")
+    assert bowl_state.last_updated == switch_state.last_updated
+    assert bowl_state.context == switch_state.context
+    assert bowl_state.last_changed != bowl_state.last_updated
+    assert len({event.context.id for event in events}) == 1
+
+    hass.states.async_set_many([("light.ceiling", "off", None, True)])
+    await hass.async_block_till_done()
+    assert len(events) == 3
+
+    hass.states.async_set_many(
+        [
+            ("light.ceiling", "off", None, True),
+            ("light.ceiling", "off", None, False),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert len(events) == 4
+
+    hass.states.async_set_many(
+        [
+            ("switch.new", "on", None, False),
+            ("switch.new", "off", None, False),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert len(events) == 4
+
+
+async def test_statemachine_set_many_invalid_state(hass: HomeAssistant) -> None:
+    """Test no state is set when one of the states is invalid."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ("light.bowl", "on", None, False),
+                ("light.ceiling", "x" * 256, None, False),
+            ]
+        )
+    await hass.async_block_till_done()
+    assert hass.states.get("light.bowl") is None
+    assert len(events) == 0
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import os
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -6,7 +8,9 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.json import json_loads
 
 from .common import MockModule, async_get_persistent_notifications, mock_integration
 
@@ -733,3 +737,120 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+def test_manifest_cache(tmp_path: pathlib.Path) -> None:
+    """Test manifests are only read again if they changed."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+    cache_path = str(tmp_path / ".storage" / "core.manifest_cache")
+
+    cache = loader.ManifestCache(cache_path)
+    manifest = cache.read_manifest(manifest_path)
+    assert manifest == {"domain": "test", "name": "Test"}
+    # The cached manifest is not changed by changing the returned manifest
+    manifest["is_built_in"] = False
+    cache.save()
+    assert os.path.exists(cache_path)
+
+    cache = loader.ManifestCache(cache_path)
+    with patch.object(
+        pathlib.Path, "read_text", side_effect=AssertionError("not cached")
+    ):
+        assert cache.read_manifest(manifest_path) == {"domain": "test", "name": "Test"}
+
+    manifest_path.write_text('{"domain": "test", "name": "Changed"}')
+    assert cache.read_manifest(manifest_path) == {"domain": "test", "name": "Changed"}
+
+    with patch("homeassistant.loader.__version__", "0.0.0"):
+        cache = loader.ManifestCache(cache_path)
+        with patch.object(pathlib.Path, "read_text", wraps=manifest_path.read_text):
+            assert cache.read_manifest(manifest_path)["name"] == "Changed"
+
+
+def test_manifest_cache_prunes_unused(tmp_path: pathlib.Path) -> None:
+    """Test manifests which were not read since the start are not saved."""
+    used_path = tmp_path / "used.json"
+    used_path.write_text('{"domain": "used", "name": "Used"}')
+    removed_path = tmp_path / "removed.json"
+    removed_path.write_text('{"domain": "removed", "name": "Removed"}')
+    cache_path = str(tmp_path / "core.manifest_cache")
+
+    cache = loader.ManifestCache(cache_path)
+    cache.read_manifest(used_path)
+    cache.read_manifest(removed_path)
+    cache.save()
+    assert (
+        str(removed_path)
+        in json_loads(pathlib.Path(cache_path).read_text())["manifests"]
+    )
+
+    removed_path.unlink()
+    cache = loader.ManifestCache(cache_path)
+    assert cache.read_manifest(used_path)["name"] == "Used"
+    assert cache.read_manifest(removed_path) is None
+    cache.save()
+    assert list(json_loads(pathlib.Path(cache_path).read_text())["manifests"]) == [
+        str(used_path)
+    ]
+
+
+def test_manifest_cache_keeps_existing_unused(tmp_path: pathlib.Path) -> None:
+    """Test manifests which were not read since the start are kept if they exist."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+    cache_path = str(tmp_path / "core.manifest_cache")
+
+    cache = loader.ManifestCache(cache_path)
+    cache.read_manifest(manifest_path)
+    cache.save()
+
+    other_path = tmp_path / "other.json"
+    other_path.write_text('{"domain": "other", "name": "Other"}')
+    cache = loader.ManifestCache(cache_path)
+    assert cache.read_manifest(other_path)["name"] == "Other"
+    cache.save()
+    assert set(json_loads(pathlib.Path(cache_path).read_text())["manifests"]) == {
+        str(manifest_path),
+        str(other_path),
+    }
+
+
+def test_manifest_cache_not_a_directory(tmp_path: pathlib.Path) -> None:
+    """Test a manifest below a file is not found."""
+    file_path = tmp_path / "file"
+    file_path.write_text("")
+
+    cache = loader.ManifestCache(str(tmp_path / "core.manifest_cache"))
+    assert cache.read_manifest(file_path / "manifest.json") is None
+
+
+def test_manifest_cache_corrupt(tmp_path: pathlib.Path) -> None:
+    """Test a corrupt manifest cache is ignored."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+    cache_path = tmp_path / "core.manifest_cache"
+    cache_path.write_text("{not json")
+
+    cache = loader.ManifestCache(str(cache_path))
+    assert cache.read_manifest(manifest_path)["name"] == "Test"
+
+
+async def test_manifest_cache_saved_on_start(hass: HomeAssistant) -> None:
+    """Test the manifest cache is used to resolve integrations and saved."""
+    loader.async_setup_manifest_cache(hass)
+    cache: loader.ManifestCache = hass.data[loader.DATA_MANIFEST_CACHE]
+
+    with patch.object(cache, "read_manifest", wraps=cache.read_manifest) as mock_read:
+        integration = await loader.async_get_integration(hass, "hue")
+    assert integration.is_built_in
+    assert mock_read.call_count == 1
+
+    with patch.object(cache, "save") as mock_save:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        assert mock_save.call_count == 1
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        assert mock_save.call_count == 2